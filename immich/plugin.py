@@ -1,5 +1,6 @@
 """Immich self-hosted photo library image plugin."""
 
+import random
 from datetime import datetime
 from typing import Any
 
@@ -155,7 +156,6 @@ class ImmichImagePlugin(SelfHostedGalleryImagePlugin):
                 data = response.json()
                 assets = data.get("assets", [])
                 # Shuffle and limit
-                import random
                 random.shuffle(assets)
                 return assets[: self.count]
             else:
@@ -1,6 +1,13 @@
 """Mealie meal planning service plugin."""
 
-from datetime import datetime, timedelta
+import asyncio
+import copy
+import hashlib
+import os
+import random
+import time
+from collections.abc import Awaitable, Callable
+from datetime import date, datetime, timedelta
 from typing import Any
 
 import httpx
@@ -17,31 +24,389 @@ from app.plugins.sdk.service import (
 from app.plugins.utils.config import extract_config_value, to_int, to_str, to_bool
 from app.plugins.utils.instance_manager import handle_plugin_config_update_generic
 
+try:
+    import h2  # noqa: F401
 
-CREATE_FIELDS = (
-    ServiceConfigField(
-        "mealie_url",
-        default="",
-        converter=to_str,
-        transform=lambda value: value.rstrip("/") if value else "",
-    ),
-    ServiceConfigField(
-        "api_token",
-        default="",
-        converter=to_str,
-        transform=lambda value: value.strip() if value else "",
-    ),
-    ServiceConfigField(
-        "group_id",
-        default="",
-        converter=to_str,
-        transform=lambda value: value.strip() if value else None,
+    _H2_AVAILABLE = True
+except ImportError:
+    _H2_AVAILABLE = False
+
+
+# Meal plan endpoints across Mealie versions, newest first
+MEAL_PLAN_ENDPOINTS = (
+    "/api/households/mealplans",
+    "/api/meal-plans",
+    "/api/mealplan",
+)
+
+
+def _normalize_url(value: str | None) -> str:
+    """Strip surrounding whitespace and trailing slashes from a Mealie URL."""
+    return value.strip().rstrip("/") if value else ""
+
+
+# (key, default, converter, transform) for each instance setting, shared by
+# instance creation and configure()
+CONFIG_FIELDS: tuple[tuple[str, Any, Callable[[Any], Any], Callable[[Any], Any] | None], ...] = (
+    ("mealie_url", "", to_str, _normalize_url),
+    ("api_token", "", to_str, lambda value: value.strip() if value else ""),
+    ("group_id", "", to_str, lambda value: value.strip() if value else None),
+    ("days_ahead", 7, to_int, None),
+    ("display_order", 0, to_int, None),
+    ("fullscreen", False, to_bool, None),
+    (
+        "mealplan_endpoint",
+        "",
+        to_str,
+        lambda value: value if value in MEAL_PLAN_ENDPOINTS else None,
     ),
-    ServiceConfigField("days_ahead", default=7, converter=to_int),
-    ServiceConfigField("display_order", default=0, converter=to_int),
-    ServiceConfigField("fullscreen", default=False, converter=to_bool),
 )
 
+CREATE_FIELDS = tuple(
+    ServiceConfigField(key, default=default, converter=converter, transform=transform)
+    if transform
+    else ServiceConfigField(key, default=default, converter=converter)
+    for key, default, converter, transform in CONFIG_FIELDS
+)
+
+# Validation rules shared by the instance schema and both config validators
+MEALIE_URL_SCHEMES = ("http://", "https://")
+DAYS_AHEAD_MIN = 1
+DAYS_AHEAD_MAX = 30
+
+
+def _env_timeout(name: str, default: float) -> float:
+    """Read a positive timeout in seconds from the environment, falling back to default."""
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        value = float(raw)
+    except ValueError:
+        value = 0.0
+    # "not >" also rejects NaN
+    if not value > 0:
+        logger.warning("[Mealie] Ignoring invalid {}={!r}, using {}", name, raw, default)
+        return default
+    return value
+
+
+# Stage-specific HTTP timeouts (seconds); override via environment variables
+MEALIE_CONNECT_TIMEOUT = _env_timeout("MEALIE_CONNECT_TIMEOUT", 3.0)
+MEALIE_READ_TIMEOUT = _env_timeout("MEALIE_READ_TIMEOUT", 8.0)
+MEALIE_WRITE_TIMEOUT = _env_timeout("MEALIE_WRITE_TIMEOUT", 5.0)
+# No pool timeout: concurrent probes must not fail while waiting for a connection
+MEALIE_POOL_TIMEOUT: float | None = None
+
+# Pool sized for two connection tests at once: each runs at most four requests
+# concurrently (the user check alongside one probe per meal plan endpoint). Idle
+# sockets outlive the meal plan cache refresh interval so polling keeps reusing them.
+MEALIE_MAX_CONNECTIONS = 8
+MEALIE_KEEPALIVE_EXPIRY = 120.0
+
+# Successful connection test results, keyed by (url, sha256(token), group_id).
+# Only a hash of the token is kept so the cache never holds the secret itself.
+_TEST_CACHE: dict[tuple[str, str, str], tuple[float, dict[str, Any]]] = {}
+_TEST_CACHE_TTL = 30.0
+_TEST_CACHE_MAX_SIZE = 128
+
+# ETag and user info from the last /api/users/self response per (url, sha256(token)),
+# so repeat tests can send If-None-Match and skip parsing on 304
+_USER_ETAGS: dict[tuple[str, str], tuple[str, str, str]] = {}
+
+# Meal plan endpoint last found working per Mealie URL, by a connection test or a
+# fetch. The settings form does not send mealplan_endpoint, so config saves and
+# new instances fall back to this instead of dropping the endpoint.
+_DISCOVERED_ENDPOINTS: dict[str, str] = {}
+_DISCOVERED_ENDPOINTS_MAX_SIZE = 128
+
+# Pooled client per event loop, shared by all plugin instances and connection
+# tests so requests to Mealie reuse keep-alive connections. An AsyncClient is
+# bound to the loop it first runs on, hence one client per loop.
+_CLIENT_BY_LOOP: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+# IDs of initialized plugin instances. The last one to clean up closes the client
+# for its loop. A client used only by connection tests stays open until its loop
+# closes; the next _get_client call then closes it.
+_CLIENT_USERS: set[str] = set()
+
+# Bumped whenever Mealie config is written through handle_plugin_config_update.
+# Instances re-read their DB config when the version moves, and otherwise at most
+# once per interval to pick up writes made outside this hook.
+_CONFIG_VERSION = 0
+_CONFIG_RELOAD_INTERVAL = 60.0
+
+# Meal plan responses keyed by (plugin_id, today, start_date, end_date). Entries are
+# served while fresh, then served stale while a background refresh runs. Callers
+# get their own copy, so the cached data is never handed out.
+_MEAL_PLAN_CACHE: dict[tuple[str, str, str, str], tuple[float, dict[str, Any]]] = {}
+_MEAL_PLAN_FRESH_TTL = 60.0
+_MEAL_PLAN_STALE_TTL = 600.0
+_MEAL_PLAN_CACHE_MAX_SIZE = 128
+_MEAL_PLAN_REFRESHES: dict[tuple[str, str, str, str], asyncio.Task] = {}
+# Bumped per plugin_id when its cached meal plans are dropped, so a refresh that
+# started under the old config does not write its result back
+_MEAL_PLAN_GENERATIONS: dict[str, int] = {}
+
+
+# Copied into the Picsum plugin, which ships separately; keep the two in step
+async def _retry(
+    op: Callable[[], Awaitable[httpx.Response]],
+    *,
+    attempts: int = 3,
+    base: float = 0.2,
+    cap: float = 2.0,
+) -> httpx.Response:
+    """
+    Run an HTTP request, retrying transient failures with full-jitter backoff.
+
+    Transport errors and 5xx responses are retried; any other status (including
+    401/403/404) is returned immediately. A read timeout means the server is up
+    but slow, so it is re-raised at once rather than making the user wait out
+    several more. After the last attempt the transport error is re-raised or the
+    final 5xx response is returned.
+    """
+    for attempt in range(attempts - 1):
+        try:
+            response = await op()
+        except httpx.ReadTimeout:
+            raise
+        except httpx.TransportError:
+            pass
+        else:
+            if response.status_code < 500:
+                return response
+        await asyncio.sleep(random.uniform(0, min(cap, base * 2**attempt)))
+    return await op()
+
+
+async def _race_meal_plan_probes(
+    client: httpx.AsyncClient,
+    mealie_url: str,
+    endpoints: tuple[str, ...],
+    headers: httpx.Headers,
+    params: dict[str, Any],
+) -> tuple[str, httpx.Response] | None:
+    """
+    Probe meal plan endpoints concurrently and return the first 200/403 answer.
+
+    Answers are resolved in endpoint order, so a fast reply from a later
+    endpoint never beats an earlier one. The remaining probes are cancelled as
+    soon as a winner is found. Returns None if every endpoint answered 404 or
+    another unusable status.
+    """
+
+    async def probe(endpoint: str) -> tuple[str, httpx.Response]:
+        # Built once so retries do not reformat it
+        url = mealie_url + endpoint
+        response = await _retry(lambda: client.get(url, headers=headers, params=params))
+        return endpoint, response
+
+    probes = [asyncio.create_task(probe(endpoint)) for endpoint in endpoints]
+    try:
+        for next_probe in probes:
+            endpoint, response = await next_probe
+            if response.status_code in (200, 403):
+                return endpoint, response
+            if response.status_code != 404:
+                logger.warning(
+                    "[Mealie] Meal plan endpoint {} returned {}", endpoint, response.status_code
+                )
+    finally:
+        for task in probes:
+            task.cancel()
+        await asyncio.gather(*probes, return_exceptions=True)
+    return None
+
+
+async def _discover_meal_plan_endpoint(
+    client: httpx.AsyncClient,
+    mealie_url: str,
+    headers: httpx.Headers,
+    params: dict[str, Any],
+    remembered_endpoint: str | None = None,
+) -> tuple[str, httpx.Response] | None:
+    """
+    Find the meal plan endpoint exposed by this Mealie version.
+
+    A remembered endpoint is probed on its own first; the remaining endpoints
+    are only raced when it no longer answers.
+    """
+    if remembered_endpoint in MEAL_PLAN_ENDPOINTS:
+        probe_rounds = (
+            (remembered_endpoint,),
+            tuple(ep for ep in MEAL_PLAN_ENDPOINTS if ep != remembered_endpoint),
+        )
+    else:
+        probe_rounds = (MEAL_PLAN_ENDPOINTS,)
+
+    for endpoints in probe_rounds:
+        winner = await _race_meal_plan_probes(client, mealie_url, endpoints, headers, params)
+        if winner:
+            return winner
+    return None
+
+
+async def _check_recipes(
+    client: httpx.AsyncClient, mealie_url: str, headers: httpx.Headers
+) -> bool:
+    """Check that the recipes API answers, without downloading recipe data."""
+    try:
+        # HEAD is enough to confirm reachability without a response body
+        response = await client.head(f"{mealie_url}/api/recipes", headers=headers)
+        if response.status_code == 405:
+            response = await client.get(
+                f"{mealie_url}/api/recipes",
+                headers=headers,
+                params={"perPage": 1},
+            )
+        return 200 <= response.status_code < 400
+    except Exception:
+        return False
+
+
+def _cache_test_result(key: tuple[str, str, str], result: dict[str, Any]) -> None:
+    """Store a successful connection test result, evicting expired entries when full."""
+    now = time.monotonic()
+    if len(_TEST_CACHE) >= _TEST_CACHE_MAX_SIZE:
+        for stale_key in [k for k, (ts, _) in _TEST_CACHE.items() if now - ts >= _TEST_CACHE_TTL]:
+            del _TEST_CACHE[stale_key]
+        if len(_TEST_CACHE) >= _TEST_CACHE_MAX_SIZE:
+            del _TEST_CACHE[min(_TEST_CACHE, key=lambda k: _TEST_CACHE[k][0])]
+    _TEST_CACHE[key] = (now, result)
+
+
+def _remember_endpoint(mealie_url: str, endpoint: str) -> None:
+    """Record the meal plan endpoint that answered for a Mealie URL."""
+    known = mealie_url in _DISCOVERED_ENDPOINTS
+    if not known and len(_DISCOVERED_ENDPOINTS) >= _DISCOVERED_ENDPOINTS_MAX_SIZE:
+        del _DISCOVERED_ENDPOINTS[next(iter(_DISCOVERED_ENDPOINTS))]
+    _DISCOVERED_ENDPOINTS[mealie_url] = endpoint
+
+
+def _known_endpoint(mealie_url: str, endpoint: str | None) -> str | None:
+    """Return endpoint if it is a valid meal plan endpoint, else the one discovered for the URL."""
+    if endpoint in MEAL_PLAN_ENDPOINTS:
+        return endpoint
+    return _DISCOVERED_ENDPOINTS.get(mealie_url)
+
+
+def _forget_meal_plans(plugin_id: str) -> None:
+    """Drop cached meal plan responses for a plugin instance."""
+    _MEAL_PLAN_GENERATIONS[plugin_id] = _MEAL_PLAN_GENERATIONS.get(plugin_id, 0) + 1
+    for key in [k for k in _MEAL_PLAN_CACHE if k[0] == plugin_id]:
+        del _MEAL_PLAN_CACHE[key]
+
+
+def _connection_config_error(mealie_url: str | None, api_token: str | None) -> str | None:
+    """Return why the connection settings are unusable, or None if they are valid."""
+    url = mealie_url.strip() if mealie_url else ""
+    if not url:
+        return "missing URL"
+    if not api_token or not api_token.strip():
+        return "missing API token"
+    if not url.startswith(MEALIE_URL_SCHEMES):
+        return "invalid URL"
+    return None
+
+
+def _meal_plan_requests(
+    endpoints: tuple[str, ...],
+    params: dict[str, str],
+    base_params: dict[str, str],
+) -> list[tuple[str, dict[str, str]]]:
+    """
+    List (endpoint, params) requests for the given meal plan endpoints, in order.
+
+    When params carries a group_id, the households endpoint is also tried without
+    it (base_params), since not every Mealie version accepts the parameter there.
+    """
+    requests = []
+    for endpoint in endpoints:
+        requests.append((endpoint, params))
+        if endpoint == "/api/households/mealplans" and params is not base_params:
+            requests.append((endpoint, base_params))
+    return requests
+
+
+def _parse_date(value: str | None) -> date | None:
+    """Parse a YYYY-MM-DD date (or full ISO timestamp), returning None if invalid."""
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except (ValueError, TypeError):
+        pass
+    try:
+        return datetime.fromisoformat(value).date()
+    except (ValueError, TypeError):
+        return None
+
+
+def _response_snippet(response: httpx.Response, limit: int = 500) -> str:
+    """Return the start of a response body for logging, or "" if it cannot be read."""
+    try:
+        # Decode only the bytes being logged rather than the whole body
+        return response.content[:limit].decode(response.encoding or "utf-8", errors="replace")
+    except Exception:
+        return ""
+
+
+async def _close_client(client: httpx.AsyncClient) -> None:
+    """Close a pooled client, tolerating one whose event loop has already closed."""
+    try:
+        await client.aclose()
+    except Exception as e:
+        # Sockets bound to a closed loop cannot be shut down from here; GC reclaims them
+        logger.debug("[Mealie] Could not close HTTP client: {}: {}", type(e).__name__, e)
+
+
+async def _get_client() -> httpx.AsyncClient:
+    """
+    Return the shared Mealie HTTP client for the running event loop.
+
+    The client is created on first use. Creation does not await, so no lock is
+    needed to keep concurrent callers on the same loop from racing; clients of
+    closed loops are only closed once the new client is in place.
+    """
+    loop = asyncio.get_running_loop()
+    client = _CLIENT_BY_LOOP.get(loop)
+    stale_clients = []
+    if client is None or client.is_closed:
+        # Drop clients whose loop has gone away (e.g. between test runs)
+        for stale_loop in [lp for lp in _CLIENT_BY_LOOP if lp.is_closed()]:
+            stale_clients.append(_CLIENT_BY_LOOP.pop(stale_loop))
+        # HTTP/2 multiplexes the concurrent probes over one connection; httpx
+        # falls back to HTTP/1.1 when the server does not negotiate h2
+        client = httpx.AsyncClient(
+            http2=_H2_AVAILABLE,
+            limits=httpx.Limits(
+                max_keepalive_connections=MEALIE_MAX_CONNECTIONS,
+                max_connections=MEALIE_MAX_CONNECTIONS,
+                keepalive_expiry=MEALIE_KEEPALIVE_EXPIRY,
+            ),
+            timeout=httpx.Timeout(
+                connect=MEALIE_CONNECT_TIMEOUT,
+                read=MEALIE_READ_TIMEOUT,
+                write=MEALIE_WRITE_TIMEOUT,
+                pool=MEALIE_POOL_TIMEOUT,
+            ),
+        )
+        _CLIENT_BY_LOOP[loop] = client
+    for stale_client in stale_clients:
+        await _close_client(stale_client)
+    return client
+
+
+async def _release_client(plugin_id: str) -> None:
+    """Stop tracking a plugin instance, closing the loop's client after the last one."""
+    _CLIENT_USERS.discard(plugin_id)
+    if _CLIENT_USERS:
+        return
+    client = _CLIENT_BY_LOOP.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await _close_client(client)
+
 
 class MealieServicePlugin(ServicePlugin):
     """Mealie service plugin for displaying meal plans."""
@@ -102,8 +467,8 @@ class MealieServicePlugin(ServicePlugin):
                         "placeholder": "7",
                         "help_text": "Number of days from today to display meals (e.g., 7 for a week)",  # noqa: E501
                         "validation": {
-                            "min": 1,
-                            "max": 30,
+                            "min": DAYS_AHEAD_MIN,
+                            "max": DAYS_AHEAD_MAX,
                         },
                     },
                 },
@@ -217,6 +582,7 @@ class MealieServicePlugin(ServicePlugin):
         enabled: bool = True,
         display_order: int = 0,
         fullscreen: bool = False,
+        mealplan_endpoint: str | None = None,
     ):
         """
         Initialize Mealie service plugin.
@@ -231,41 +597,45 @@ class MealieServicePlugin(ServicePlugin):
             enabled: Whether the plugin is enabled
             display_order: Display order for service rotation
             fullscreen: Whether to display in fullscreen mode
+            mealplan_endpoint: Meal plan endpoint discovered previously, tried first
         """
         super().__init__(plugin_id, name, enabled)
-        self.mealie_url = mealie_url.rstrip("/")
-        self.api_token = api_token
+        # Stored normalized so request paths can use them as-is
+        self.mealie_url = _normalize_url(mealie_url)
+        self.api_token = api_token.strip() if api_token else ""
         self.group_id = group_id
         self.days_ahead = days_ahead
         self.display_order = display_order
         self.fullscreen = fullscreen
+        self.mealplan_endpoint = _known_endpoint(self.mealie_url, mealplan_endpoint)
         self._client: httpx.AsyncClient | None = None
+        self._auth_headers: dict[str, str] = {}
+        # Backend endpoint that proxies Mealie API calls; plugin_id never changes
+        self._data_url = f"/api/plugins/{plugin_id}/data"
+        self._config_version_seen: int | None = None
+        self._config_checked_at = 0.0
 
     async def initialize(self) -> None:
         """Initialize the plugin."""
         # Validate URL
-        if not self.mealie_url or not (
-            self.mealie_url.startswith("http://") or self.mealie_url.startswith("https://")
-        ):
+        if not self.mealie_url or not self.mealie_url.startswith(MEALIE_URL_SCHEMES):
             raise ValueError(f"Invalid Mealie URL: {self.mealie_url}")
 
         # Validate API token
-        if not self.api_token or not self.api_token.strip():
+        if not self.api_token:
             raise ValueError("Mealie API token is required but not set")
 
-        # Create HTTP client with authentication
-        headers = {"Authorization": f"Bearer {self.api_token.strip()}"}
-        self._client = httpx.AsyncClient(
-            base_url=self.mealie_url,
-            headers=headers,
-            timeout=30.0,
-        )
+        # Requests go through the shared pooled client with per-request auth
+        self._auth_headers = {"Authorization": f"Bearer {self.api_token}"}
+        self._client = await _get_client()
+        _CLIENT_USERS.add(self.plugin_id)
 
     async def cleanup(self) -> None:
         """Cleanup plugin resources."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        # The pooled client is shared with other instances; only the last one closes it
+        self._client = None
+        _forget_meal_plans(self.plugin_id)
+        await _release_client(self.plugin_id)
 
     async def get_content(self) -> dict[str, Any]:
         """
@@ -278,11 +648,9 @@ class MealieServicePlugin(ServicePlugin):
         # The frontend will detect "mealie" type and fetch data from our API
         # This avoids CORS issues and handles authentication properly
         # Use generic /data endpoint for forward compatibility
-        meal_plan_api_url = f"/api/plugins/{self.plugin_id}/data"
-
         return {
             "type": "mealie",
-            "url": meal_plan_api_url,  # Points to our backend endpoint
+            "url": self._data_url,  # Points to our backend endpoint
             "data": {
                 "mealie_url": self.mealie_url,
                 "api_token": self.api_token,  # Not sent to frontend, used by backend
@@ -302,15 +670,15 @@ class MealieServicePlugin(ServicePlugin):
         """
         # Store the meal plan API URL in config so web_service_service can read it
         # This points to our backend endpoint that proxies Mealie API calls
-        meal_plan_api_url = f"/api/plugins/{self.plugin_id}/data"
         return {
-            "url": meal_plan_api_url,
+            "url": self._data_url,
             "mealie_url": self.mealie_url,
             "api_token": self.api_token,
             "group_id": self.group_id,
             "days_ahead": self.days_ahead,
             "display_order": self.display_order,
             "fullscreen": self.fullscreen,
+            "mealplan_endpoint": self.mealplan_endpoint,
         }
 
     async def fetch_service_data(
@@ -333,6 +701,32 @@ class MealieServicePlugin(ServicePlugin):
         # with stale config, and the API token might have been updated
         await self._reload_config_from_db()
 
+        # Today is part of the key so default date ranges roll over at midnight
+        key = (self.plugin_id, date.today().isoformat(), start_date or "", end_date or "")
+        cached = _MEAL_PLAN_CACHE.get(key)
+        if cached:
+            age = time.monotonic() - cached[0]
+            if age < _MEAL_PLAN_FRESH_TTL:
+                return copy.deepcopy(cached[1])
+            if age < _MEAL_PLAN_STALE_TTL:
+                if key not in _MEAL_PLAN_REFRESHES:
+                    task = asyncio.create_task(
+                        self._refresh_service_data(key, start_date, end_date)
+                    )
+                    _MEAL_PLAN_REFRESHES[key] = task
+                    task.add_done_callback(lambda _: _MEAL_PLAN_REFRESHES.pop(key, None))
+                return copy.deepcopy(cached[1])
+
+        return await self._refresh_service_data(key, start_date, end_date)
+
+    async def _refresh_service_data(
+        self,
+        key: tuple[str, str, str, str],
+        start_date: str | None,
+        end_date: str | None,
+    ) -> dict[str, Any]:
+        """Fetch meal plan data and cache it unless the fetch reported an error."""
+        generation = _MEAL_PLAN_GENERATIONS.get(self.plugin_id, 0)
         data = await self._fetch_meal_plan(start_date=start_date, end_date=end_date)
 
         # Add mealie_url to response metadata for frontend
@@ -340,10 +734,16 @@ class MealieServicePlugin(ServicePlugin):
             if isinstance(data, dict):
                 if "_metadata" not in data:
                     data["_metadata"] = {}
-                data["_metadata"]["mealie_url"] = self.mealie_url.rstrip("/")
+                data["_metadata"]["mealie_url"] = self.mealie_url
             elif isinstance(data, list):
-                data = {"items": data, "_metadata": {"mealie_url": self.mealie_url.rstrip("/")}}
-
+                data = {"items": data, "_metadata": {"mealie_url": self.mealie_url}}
+
+        # Skip the write if the config changed (or the instance was cleaned up) meanwhile
+        stale = _MEAL_PLAN_GENERATIONS.get(self.plugin_id, 0) != generation
+        if isinstance(data, dict) and "error" not in data and not stale:
+            if len(_MEAL_PLAN_CACHE) >= _MEAL_PLAN_CACHE_MAX_SIZE and key not in _MEAL_PLAN_CACHE:
+                del _MEAL_PLAN_CACHE[min(_MEAL_PLAN_CACHE, key=lambda k: _MEAL_PLAN_CACHE[k][0])]
+            _MEAL_PLAN_CACHE[key] = (time.monotonic(), copy.deepcopy(data))
         return data
 
     async def _fetch_meal_plan(
@@ -359,135 +759,56 @@ class MealieServicePlugin(ServicePlugin):
         Returns:
             Dictionary with meal plan data
         """
-        # Log API token status before initializing
-        token_status = "present" if self.api_token else "missing"
-        token_length = len(self.api_token) if self.api_token else 0
+        # Log API token status before initializing (formatted only if emitted)
         logger.debug(
-            f"[Mealie] _fetch_meal_plan called - API token: {token_status} "
-            f"(length: {token_length}), URL: {self.mealie_url}"
+            "[Mealie] _fetch_meal_plan called - API token: {} (length: {}), URL: {}",
+            "present" if self.api_token else "missing",
+            len(self.api_token),
+            self.mealie_url,
         )
 
         if not self._client:
             await self.initialize()
 
-        try:
-            # Calculate date range
-            if start_date:
-                try:
-                    today = datetime.fromisoformat(start_date).date()
-                except (ValueError, TypeError):
-                    today = datetime.now().date()
-            else:
-                today = datetime.now().date()
+        # Calculate date range (missing or invalid dates fall back to the defaults)
+        today = _parse_date(start_date) or date.today()
+        week_end = _parse_date(end_date) or today + timedelta(days=self.days_ahead)
 
-            if end_date:
-                try:
-                    week_end = datetime.fromisoformat(end_date).date()
-                except (ValueError, TypeError):
-                    week_end = today + timedelta(days=self.days_ahead)
-            else:
-                week_end = today + timedelta(days=self.days_ahead)
-
-            # Mealie API endpoint for meal plans
-            # Based on typical REST API patterns, this might be /api/meal-plans or /api/mealplan
-            # We'll try the most common pattern first
-            params = {
-                "start_date": today.isoformat(),
-                "end_date": week_end.isoformat(),
-            }
-            if self.group_id:
-                params["group_id"] = self.group_id
-
-            # Mealie API endpoints - based on Mealie docs, use /api/households/mealplans
-            # Try with date range parameters first
-            endpoints_to_try = [
-                ("/api/households/mealplans", params),
-                # Try without group_id if it was specified
-                ("/api/households/mealplans", {k: v for k, v in params.items() if k != "group_id"}),
-                # Try alternative endpoints
-                ("/api/meal-plans", params),
-                ("/api/mealplan", params),
-            ]
-
-            for endpoint, endpoint_params in endpoints_to_try:
-                try:
-                    logger.debug(
-                        f"[Mealie] Trying endpoint: {endpoint} with params: {endpoint_params}"
-                    )
-                    response = await self._client.get(endpoint, params=endpoint_params)
-                    logger.debug(
-                        f"[Mealie] Response from {endpoint}: status={response.status_code}"
-                    )
+        start_iso = today.isoformat()
+        end_iso = week_end.isoformat()
+        # Query parameters are built once and shared by every endpoint attempt
+        base_params = {"start_date": start_iso, "end_date": end_iso}
+        params = {**base_params, "group_id": self.group_id} if self.group_id else base_params
 
-                    if response.status_code == 200:
-                        data = response.json()
-                        # Log response structure for debugging
-                        if isinstance(data, dict):
-                            item_count = (
-                                len(data.get("items", []))
-                                if "items" in data
-                                else len(data)
-                                if isinstance(data, list)
-                                else 0
-                            )
-                            logger.info(
-                                f"[Mealie] Successfully fetched meal plan from {endpoint}: "
-                                f"{item_count} items"
-                            )
-                        elif isinstance(data, list):
-                            logger.info(
-                                f"[Mealie] Successfully fetched meal plan from {endpoint}: "
-                                f"{len(data)} items"
-                            )
-                        return data
-                    elif response.status_code == 404:
-                        # Try next endpoint
-                        logger.debug(f"[Mealie] Endpoint {endpoint} returned 404, trying next...")
-                        continue
-                    else:
-                        # Log non-200, non-404 responses
-                        try:
-                            error_body = response.text[:500]  # First 500 chars
-                            logger.warning(
-                                f"[Mealie] Endpoint {endpoint} returned "
-                                f"{response.status_code}: {error_body}"
-                            )
-                        except Exception:
-                            pass
-                        response.raise_for_status()
-                except httpx.HTTPStatusError as e:
-                    if e.response.status_code == 404:
-                        logger.debug(
-                            f"[Mealie] Endpoint {endpoint} not found (404), trying next..."
-                        )
-                        continue
-                    # Log other HTTP errors
-                    try:
-                        error_body = e.response.text[:500]
-                        logger.warning(
-                            f"[Mealie] HTTP error from {endpoint}: "
-                            f"{e.response.status_code} - {error_body}"
-                        )
-                    except Exception:
-                        logger.warning(
-                            f"[Mealie] HTTP error from {endpoint}: {e.response.status_code}"
-                        )
-                    raise
-                except Exception as e:
-                    logger.exception(
-                        f"[Mealie] Unexpected error trying {endpoint}: {type(e).__name__}: {e}"
-                    )
-                    raise
+        try:
+            # Fast path: the endpoint that last worked, on its own
+            remembered = self.mealplan_endpoint
+            if remembered in MEAL_PLAN_ENDPOINTS:
+                data = await self._probe_meal_plan_endpoints(
+                    _meal_plan_requests((remembered,), params, base_params)
+                )
+                if data is not None:
+                    return data
+
+            # Slow path: discover the endpoint among the others, which also covers
+            # a Mealie upgrade that removed the remembered one
+            fallbacks = tuple(ep for ep in MEAL_PLAN_ENDPOINTS if ep != remembered)
+            data = await self._probe_meal_plan_endpoints(
+                _meal_plan_requests(fallbacks, params, base_params)
+            )
+            if data is not None:
+                return data
 
             # If all endpoints failed, return empty meal plan
-            tried_endpoints = [e[0] for e in endpoints_to_try]
-            logger.error(f"[Mealie] Could not find meal plan endpoint. Tried: {tried_endpoints}")
-            logger.error(f"[Mealie] Date range: {today.isoformat()} to {week_end.isoformat()}")
-            logger.error(f"[Mealie] Group ID: {self.group_id or 'not specified'}")
+            logger.error(
+                "[Mealie] Could not find meal plan endpoint. Tried: {}", list(MEAL_PLAN_ENDPOINTS)
+            )
+            logger.error("[Mealie] Date range: {} to {}", start_iso, end_iso)
+            logger.error("[Mealie] Group ID: {}", self.group_id or "not specified")
             return {
                 "items": [],
-                "start_date": today.isoformat(),
-                "end_date": week_end.isoformat(),
+                "start_date": start_iso,
+                "end_date": end_iso,
                 "error": "Could not find meal plan endpoint. Please check Mealie API documentation.",  # noqa: E501
             }
 
@@ -498,67 +819,142 @@ class MealieServicePlugin(ServicePlugin):
                 error_detail = (
                     "HTTP error: 401 - Authentication failed. Please check your API token."
                 )
-                # Log response body for debugging (may contain useful error info)
-                try:
-                    response_body = e.response.text
-                    logger.debug(f"[Mealie] 401 response body: {response_body[:500]}")
-                except Exception:
-                    pass
             elif e.response.status_code == 403:
                 error_detail = (
                     "HTTP error: 403 - Forbidden. "
                     "API token may not have permission to access meal plans."
                 )
-                try:
-                    response_body = e.response.text
-                    logger.debug(f"[Mealie] 403 response body: {response_body[:500]}")
-                except Exception:
-                    pass
             elif e.response.status_code == 404:
                 error_detail = (
                     "HTTP error: 404 - Meal plan endpoint not found. "
                     "Check Mealie version and API documentation."
                 )
-            else:
-                # Log response body for other errors
-                try:
-                    response_body = e.response.text
-                    logger.debug(
-                        f"[Mealie] {e.response.status_code} response body: {response_body[:500]}"
-                    )
-                except Exception:
-                    pass
 
-            logger.error(f"[Mealie] HTTP error fetching meal plan: {e.response.status_code}")
-            logger.error(f"[Mealie] Request URL: {e.request.url}")
-            logger.error(f"[Mealie] Request method: {e.request.method}")
+            # Response body may contain useful error info; only read when debugging
+            response = e.response
+            logger.opt(lazy=True).debug(
+                "[Mealie] {} response body: {}",
+                lambda: response.status_code,
+                lambda: _response_snippet(response),
+            )
+            logger.error("[Mealie] HTTP error fetching meal plan: {}", e.response.status_code)
+            logger.error("[Mealie] Request URL: {}", e.request.url)
+            logger.error("[Mealie] Request method: {}", e.request.method)
             # Log token status (without exposing the actual token)
-            token_status = "present" if self.api_token else "missing"
-            token_length = len(self.api_token) if self.api_token else 0
-            logger.error(f"[Mealie] API token status: {token_status} (length: {token_length})")
-            logger.error(f"[Mealie] Mealie URL: {self.mealie_url}")
+            logger.error(
+                "[Mealie] API token status: {} (length: {})",
+                "present" if self.api_token else "missing",
+                len(self.api_token),
+            )
+            logger.error("[Mealie] Mealie URL: {}", self.mealie_url)
             return {
                 "items": [],
                 "error": error_detail,
             }
         except httpx.HTTPError as e:
             logger.exception(
-                f"[Mealie] Network/HTTP error fetching meal plan: {type(e).__name__}: {e}"
+                "[Mealie] Network/HTTP error fetching meal plan: {}: {}", type(e).__name__, e
             )
-            logger.error(f"[Mealie] Mealie URL: {self.mealie_url}")
+            logger.error("[Mealie] Mealie URL: {}", self.mealie_url)
             return {
                 "items": [],
                 "error": f"Network error: {str(e)}",
             }
         except Exception as e:
             logger.exception(
-                f"[Mealie] Unexpected error fetching meal plan: {type(e).__name__}: {e}"
+                "[Mealie] Unexpected error fetching meal plan: {}: {}", type(e).__name__, e
             )
             return {
                 "items": [],
                 "error": f"Unexpected error: {str(e)}",
             }
 
+    async def _probe_meal_plan_endpoints(
+        self, endpoints: list[tuple[str, dict[str, Any]]]
+    ) -> Any | None:
+        """
+        Request several meal plan endpoints concurrently.
+
+        Responses are taken in list order, so an earlier endpoint still wins over
+        a later one that answered faster. Outstanding requests are cancelled once
+        a result is found.
+
+        Returns:
+            Meal plan data from the first endpoint that answered 200, or None if
+            every endpoint answered 404
+
+        Raises:
+            httpx.HTTPStatusError: If an endpoint answered with another error status
+        """
+        requests = []
+        for endpoint, endpoint_params in endpoints:
+            logger.debug("[Mealie] Trying endpoint: {} with params: {}", endpoint, endpoint_params)
+            requests.append(
+                asyncio.create_task(
+                    self._client.get(
+                        self.mealie_url + endpoint,
+                        params=endpoint_params,
+                        headers=self._auth_headers,
+                    )
+                )
+            )
+
+        try:
+            for (endpoint, _), request in zip(endpoints, requests):
+                try:
+                    response = await request
+                    logger.debug(
+                        "[Mealie] Response from {}: status={}", endpoint, response.status_code
+                    )
+
+                    if response.status_code == 200:
+                        data = response.json()
+                        # Remember the working endpoint; get_config and config saves keep it
+                        self.mealplan_endpoint = endpoint
+                        _remember_endpoint(self.mealie_url, endpoint)
+                        # Mealie returns either a paginated dict or a bare list
+                        data_type = type(data)
+                        if data_type is dict:
+                            item_count = len(data["items"]) if "items" in data else 0
+                        else:
+                            item_count = len(data) if data_type is list else 0
+                        logger.info(
+                            "[Mealie] Successfully fetched meal plan from {}: {} items",
+                            endpoint,
+                            item_count,
+                        )
+                        return data
+                    elif response.status_code == 404:
+                        # Try next endpoint
+                        logger.debug("[Mealie] Endpoint {} returned 404, trying next...", endpoint)
+                        continue
+                    else:
+                        # Non-200, non-404 responses are logged by the handler below
+                        response.raise_for_status()
+                except httpx.HTTPStatusError as e:
+                    if e.response.status_code == 404:
+                        logger.debug(
+                            "[Mealie] Endpoint {} not found (404), trying next...", endpoint
+                        )
+                        continue
+                    logger.warning(
+                        "[Mealie] HTTP error from {}: {} - {}",
+                        endpoint,
+                        e.response.status_code,
+                        _response_snippet(e.response),
+                    )
+                    raise
+                except Exception as e:
+                    logger.exception(
+                        "[Mealie] Unexpected error trying {}: {}: {}", endpoint, type(e).__name__, e
+                    )
+                    raise
+        finally:
+            for request in requests:
+                request.cancel()
+            await asyncio.gather(*requests, return_exceptions=True)
+        return None
+
     async def validate_config(self, config: dict[str, Any]) -> bool:
         """
         Validate plugin configuration.
@@ -569,24 +965,15 @@ class MealieServicePlugin(ServicePlugin):
         Returns:
             True if configuration is valid
         """
-        # Check required fields
         mealie_url = extract_config_value(config, "mealie_url", default="", converter=to_str)
         api_token = extract_config_value(config, "api_token", default="", converter=to_str)
-
-        if not mealie_url or not mealie_url.strip():
-            return False
-        if not api_token or not api_token.strip():
-            return False
-
-        # URL must be valid
-        url = mealie_url.strip()
-        if not url.startswith("http://") and not url.startswith("https://"):
+        if _connection_config_error(mealie_url, api_token):
             return False
 
         # Days ahead should be valid if provided
         if "days_ahead" in config:
             days_ahead = extract_config_value(config, "days_ahead", default=7, converter=to_int)
-            if days_ahead < 1 or days_ahead > 30:
+            if not DAYS_AHEAD_MIN <= days_ahead <= DAYS_AHEAD_MAX:
                 return False
 
         return True
@@ -599,32 +986,21 @@ class MealieServicePlugin(ServicePlugin):
             config: Configuration dictionary
         """
         await super().configure(config)
+        # Settings such as group_id or days_ahead change what the meal plan contains
+        _forget_meal_plans(self.plugin_id)
 
-        # Close existing client if any
-        if self._client:
-            await self._client.aclose()
-
-        if "mealie_url" in config:
-            mealie_url = extract_config_value(config, "mealie_url", default="", converter=to_str)
-            self.mealie_url = mealie_url.rstrip("/") if mealie_url else ""
-        if "api_token" in config:
-            api_token = extract_config_value(config, "api_token", default="", converter=to_str)
-            self.api_token = api_token.strip() if api_token else ""
-        if "group_id" in config:
-            group_id = extract_config_value(config, "group_id", default="", converter=to_str)
-            self.group_id = group_id.strip() if group_id else None
-        if "days_ahead" in config:
-            self.days_ahead = extract_config_value(
-                config, "days_ahead", default=7, converter=to_int
-            )
-        if "display_order" in config:
-            self.display_order = extract_config_value(
-                config, "display_order", default=0, converter=to_int
-            )
-        if "fullscreen" in config:
-            self.fullscreen = extract_config_value(
-                config, "fullscreen", default=False, converter=to_bool
-            )
+        previous_connection = (self.mealie_url, self.api_token)
+
+        for key, default, converter, transform in CONFIG_FIELDS:
+            if key in config:
+                value = extract_config_value(config, key, default=default, converter=converter)
+                setattr(self, key, transform(value) if transform else value)
+        # A config without an endpoint must not drop the one already discovered
+        self.mealplan_endpoint = _known_endpoint(self.mealie_url, self.mealplan_endpoint)
+
+        # Nothing to revalidate when the connection settings did not change
+        if self._client and (self.mealie_url, self.api_token) == previous_connection:
+            return
 
         # Reinitialize with new config
         await self.initialize()
@@ -634,61 +1010,76 @@ class MealieServicePlugin(ServicePlugin):
         Reload plugin config from database to ensure we have the latest values,
         especially the API token which might have been updated.
         """
+        now = time.monotonic()
+        if (
+            self._config_version_seen == _CONFIG_VERSION
+            and now - self._config_checked_at < _CONFIG_RELOAD_INTERVAL
+        ):
+            return
+        self._config_version_seen = _CONFIG_VERSION
+        self._config_checked_at = now
+
+        # Imported here rather than at module level: loading the DB models pulls
+        # in the backend's database layer, which plugin discovery should not need
         from app.models.db_models import PluginDB
 
         try:
-            logger.debug(f"[Mealie] Reloading config from DB for plugin_id: {self.plugin_id}")
+            logger.debug("[Mealie] Reloading config from DB for plugin_id: {}", self.plugin_id)
             db_plugin = await PluginDB.objects.get_or_none(id=self.plugin_id)
 
             if not db_plugin:
-                logger.warning(f"[Mealie] Plugin {self.plugin_id} not found in database")
+                logger.warning("[Mealie] Plugin {} not found in database", self.plugin_id)
                 return
 
             if not db_plugin.config:
-                logger.warning(f"[Mealie] Plugin {self.plugin_id} has no config in database")
+                logger.warning("[Mealie] Plugin {} has no config in database", self.plugin_id)
                 return
 
             config = db_plugin.config
-            logger.debug(f"[Mealie] Found config in DB with keys: {list(config.keys())}")
+            logger.opt(lazy=True).debug(
+                "[Mealie] Found config in DB with keys: {}", lambda: list(config.keys())
+            )
 
             # Check if API token has changed
-            new_api_token = config.get("api_token", "")
-            if isinstance(new_api_token, dict):
-                new_api_token = new_api_token.get("value") or new_api_token.get("default") or ""
-            new_api_token = str(new_api_token).strip() if new_api_token else ""
+            new_api_token = extract_config_value(config, "api_token", default="", converter=to_str)
+            new_api_token = new_api_token.strip() if new_api_token else ""
 
-            current_token_length = len(self.api_token) if self.api_token else 0
-            new_token_length = len(new_api_token) if new_api_token else 0
+            current_token_length = len(self.api_token)
+            new_token_length = len(new_api_token)
             logger.debug(
-                f"[Mealie] Token comparison - current: {current_token_length} chars, "
-                f"new: {new_token_length} chars"
+                "[Mealie] Token comparison - current: {} chars, new: {} chars",
+                current_token_length,
+                new_token_length,
             )
 
             # Only reconfigure if API token has changed or is missing
             if new_api_token and new_api_token != self.api_token:
                 logger.info(
-                    f"[Mealie] API token changed, reloading config from database "
-                    f"(old length: {len(self.api_token)}, new length: {len(new_api_token)})"
+                    "[Mealie] API token changed, reloading config from database "
+                    "(old length: {}, new length: {})",
+                    current_token_length,
+                    new_token_length,
                 )
                 await self.configure(config)
             elif not self.api_token and new_api_token:
                 logger.info(
-                    f"[Mealie] API token was missing, reloading config from database "
-                    f"(new length: {len(new_api_token)})"
+                    "[Mealie] API token was missing, reloading config from database "
+                    "(new length: {})",
+                    new_token_length,
                 )
                 await self.configure(config)
             else:
                 logger.debug("[Mealie] API token unchanged, no reload needed")
         except Exception as e:
-            logger.exception(f"[Mealie] Error reloading config from database: {e}")
+            logger.exception("[Mealie] Error reloading config from database: {}", e)
             # Don't fail the request if we can't reload config
             # The existing config might still work
 
     @classmethod
     async def test_type_config(cls, config: dict[str, Any]) -> dict[str, Any] | None:
         """Test Mealie API connection and verify API token permissions."""
-        mealie_url = config.get("mealie_url", "").rstrip("/")
-        api_token = config.get("api_token", "")
+        mealie_url = _normalize_url(config.get("mealie_url"))
+        api_token = (config.get("api_token") or "").strip()
         group_id = config.get("group_id", "")
 
         if not mealie_url or not api_token:
@@ -697,23 +1088,78 @@ class MealieServicePlugin(ServicePlugin):
                 "message": "Mealie URL and API token are required",
             }
 
-        headers = {"Authorization": f"Bearer {api_token}"}
+        cache_key = (mealie_url, hashlib.sha256(api_token.encode()).hexdigest(), group_id or "")
+        cached = _TEST_CACHE.get(cache_key)
+        if cached and time.monotonic() - cached[0] < _TEST_CACHE_TTL:
+            logger.debug("[Mealie Test] Returning cached result for {}", mealie_url)
+            # Callers get their own copy so none can alter what later tests return
+            return dict(cached[1])
+
+        # Built once and passed by reference to every request in this test
+        headers = httpx.Headers(
+            {"Authorization": f"Bearer {api_token}", "Accept": "application/json"}
+        )
         test_results = []
 
+        # Built once and shared by every probe (httpx does not mutate params)
+        today = date.today()
+        start_iso = today.isoformat()
+        end_iso = (today + timedelta(days=7)).isoformat()
+        # One item per page keeps the body small; paginated responses still
+        # report the full count in "total"
+        meal_plan_params: dict[str, Any] = {
+            "start_date": start_iso,
+            "end_date": end_iso,
+            "perPage": 1,
+        }
+        if group_id:
+            meal_plan_params["group_id"] = group_id
+
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                logger.info(f"[Mealie Test] Testing connection to {mealie_url}...")
+            client = await _get_client()
+            logger.info("[Mealie Test] Testing connection to {}...", mealie_url)
+
+            # Start meal plan discovery alongside the auth check; it is cancelled
+            # as soon as authentication fails
+            meal_plan_task = asyncio.create_task(
+                _discover_meal_plan_endpoint(
+                    client,
+                    mealie_url,
+                    headers,
+                    meal_plan_params,
+                    _known_endpoint(mealie_url, config.get("mealplan_endpoint")),
+                )
+            )
+            try:
+                etag_key = cache_key[:2]
+                cached_user = _USER_ETAGS.get(etag_key)
+                auth_headers = headers
+                if cached_user:
+                    auth_headers = httpx.Headers(headers)
+                    auth_headers["If-None-Match"] = cached_user[0]
                 try:
-                    response = await client.get(
-                        f"{mealie_url}/api/users/self",
-                        headers=headers,
+                    response = await _retry(
+                        lambda: client.get(f"{mealie_url}/api/users/self", headers=auth_headers)
                     )
-                    if response.status_code == 200:
+                    if response.status_code == 304 and cached_user:
+                        _, user_id, username = cached_user
+                        test_results.append(f"Authentication successful (user: {username})")
+                        logger.info(
+                            "[Mealie Test] User unchanged (304): {} (ID: {})", username, user_id
+                        )
+                    elif response.status_code == 200:
                         user_data = response.json()
                         user_id = user_data.get("id", "unknown")
                         username = user_data.get("username", "unknown")
+                        etag = response.headers.get("etag")
+                        if etag:
+                            if len(_USER_ETAGS) >= _TEST_CACHE_MAX_SIZE:
+                                del _USER_ETAGS[next(iter(_USER_ETAGS))]
+                            _USER_ETAGS[etag_key] = (etag, user_id, username)
                         test_results.append(f"Authentication successful (user: {username})")
-                        logger.info(f"[Mealie Test] User authenticated: {username} (ID: {user_id})")
+                        logger.info(
+                            "[Mealie Test] User authenticated: {} (ID: {})", username, user_id
+                        )
                     elif response.status_code == 401:
                         return {
                             "success": False,
@@ -722,7 +1168,9 @@ class MealieServicePlugin(ServicePlugin):
                     else:
                         return {
                             "success": False,
-                            "message": f"Authentication check failed. Status: {response.status_code}",
+                            "message": (
+                                f"Authentication check failed. Status: {response.status_code}"
+                            ),
                         }
                 except httpx.HTTPStatusError as e:
                     if e.response.status_code == 401:
@@ -736,128 +1184,121 @@ class MealieServicePlugin(ServicePlugin):
                     }
 
                 logger.info("[Mealie Test] Testing meal plan access...")
-                from datetime import datetime, timedelta
-
-                today = datetime.now().date()
-                end_date = today + timedelta(days=7)
-                meal_plan_params = {
-                    "start_date": today.isoformat(),
-                    "end_date": end_date.isoformat(),
-                }
-                if group_id:
-                    meal_plan_params["group_id"] = group_id
-
-                meal_plan_endpoints = [
-                    "/api/households/mealplans",
-                    "/api/meal-plans",
-                    "/api/mealplan",
-                ]
-
-                meal_plan_accessible = False
-                for endpoint in meal_plan_endpoints:
-                    try:
-                        response = await client.get(
-                            f"{mealie_url}{endpoint}",
-                            headers=headers,
-                            params=meal_plan_params,
-                        )
-                        if response.status_code == 200:
-                            meal_plan_accessible = True
-                            data = response.json()
-                            item_count = 0
-                            if isinstance(data, dict):
-                                item_count = len(data.get("items", [])) if "items" in data else 0
-                            elif isinstance(data, list):
-                                item_count = len(data)
-                            test_results.append(
-                                f"Meal plan access successful ({endpoint}: {item_count} items found)"
-                            )
-                            logger.info(
-                                f"[Mealie Test] Meal plan endpoint {endpoint} accessible: "
-                                f"{item_count} items"
-                            )
-                            break
-                        if response.status_code == 404:
-                            continue
-                        if response.status_code == 403:
-                            test_results.append(
-                                "Meal plan endpoint accessible but permission denied (403)"
-                            )
-                            logger.warning(
-                                f"[Mealie Test] Meal plan endpoint {endpoint} returned 403 "
-                                "(permission denied)"
-                            )
-                            break
-                        logger.warning(
-                            f"[Mealie Test] Meal plan endpoint {endpoint} returned "
-                            f"{response.status_code}"
-                        )
-                    except httpx.HTTPStatusError as e:
-                        if e.response.status_code == 404:
-                            continue
-                        if e.response.status_code == 403:
-                            test_results.append(
-                                "Meal plan endpoint accessible but permission denied (403)"
-                            )
-                            logger.warning(
-                                f"[Mealie Test] Meal plan endpoint {endpoint} returned 403"
-                            )
-                            break
-                        logger.warning(
-                            f"[Mealie Test] Meal plan endpoint {endpoint} error: "
-                            f"{e.response.status_code}"
-                        )
-
-                if not meal_plan_accessible:
-                    test_results.append(
-                        "Could not access meal plan endpoint (may not have meal plans or wrong endpoint)"
-                    )
-
-                try:
-                    response = await client.get(
-                        f"{mealie_url}/api/recipes",
-                        headers=headers,
-                        params={"perPage": 1},
-                    )
-                    if response.status_code == 200:
-                        test_results.append("Recipes API accessible")
-                        logger.info("[Mealie Test] Recipes endpoint accessible")
-                except Exception:
-                    pass
-
-                if meal_plan_accessible:
-                    message = "Connection successful!\n" + "\n".join(test_results)
-                    return {
-                        "success": True,
-                        "message": message,
-                    }
+                winner = await meal_plan_task
+            finally:
+                # No-op once discovery finished; frees connections when auth failed
+                meal_plan_task.cancel()
+                await asyncio.gather(meal_plan_task, return_exceptions=True)
+
+            meal_plan_accessible = False
+            discovered_endpoint = None
+            if winner and winner[1].status_code == 200:
+                endpoint, response = winner
+                meal_plan_accessible = True
+                discovered_endpoint = endpoint
+                _remember_endpoint(mealie_url, endpoint)
+                data = response.json()
+                item_count = 0
+                if isinstance(data, dict):
+                    if "total" in data:
+                        item_count = data["total"]
+                    elif "items" in data:
+                        item_count = len(data["items"])
+                elif isinstance(data, list):
+                    item_count = len(data)
+                test_results.append(
+                    f"Meal plan access successful ({endpoint}: {item_count} items found)"
+                )
+                logger.info(
+                    "[Mealie Test] Meal plan endpoint {} accessible: {} items",
+                    endpoint,
+                    item_count,
+                )
+            elif winner:
+                test_results.append("Meal plan endpoint accessible but permission denied (403)")
+                logger.warning(
+                    "[Mealie Test] Meal plan endpoint {} returned 403 (permission denied)",
+                    winner[0],
+                )
 
-                message = (
-                    "Connection successful, but meal plan access failed.\n"
-                    + "\n".join(test_results)
-                    + "\n\nPlease verify:"
-                    + "\n- API token has permission to access meal plans"
-                    + "\n- Meal plans exist for the date range "
-                    + f"({today.isoformat()} to {end_date.isoformat()})"
-                    + "\n- Group ID is correct (if specified)"
+            if not meal_plan_accessible:
+                test_results.append(
+                    "Could not access meal plan endpoint (may not have meal plans or wrong endpoint)"
                 )
-                return {
-                    "success": False,
+                # A working meal plan endpoint already proves the API works; only
+                # check recipes to tell a meal plan problem from a broken API
+                if await _check_recipes(client, mealie_url, headers):
+                    test_results.append("Recipes API accessible")
+                    logger.info("[Mealie Test] Recipes endpoint accessible")
+
+            if meal_plan_accessible:
+                message = "Connection successful!\n" + "\n".join(test_results)
+                result = {
+                    "success": True,
                     "message": message,
+                    "discovered_endpoint": discovered_endpoint,
                 }
+                _cache_test_result(cache_key, dict(result))
+                return result
+
+            message = "\n".join(
+                [
+                    "Connection successful, but meal plan access failed.",
+                    *test_results,
+                    "",
+                    "Please verify:",
+                    "- API token has permission to access meal plans",
+                    f"- Meal plans exist for the date range ({start_iso} to {end_iso})",
+                    "- Group ID is correct (if specified)",
+                ]
+            )
+            return {
+                "success": False,
+                "message": message,
+            }
 
         except httpx.ConnectError:
             return {
                 "success": False,
                 "message": f"Could not connect to {mealie_url}. Please check the URL.",
             }
+        except httpx.ConnectTimeout:
+            return {
+                "success": False,
+                "message": (
+                    f"Connecting to {mealie_url} timed out. "
+                    "Please check the URL and that the server is reachable."
+                ),
+            }
+        except httpx.ReadTimeout:
+            return {
+                "success": False,
+                "message": (
+                    f"Mealie at {mealie_url} accepted the connection but was too slow to respond. "
+                    "Please try again later."
+                ),
+            }
         except httpx.TimeoutException:
             return {
                 "success": False,
                 "message": f"Connection to {mealie_url} timed out. Please check the URL and network.",
             }
+        except httpx.HTTPError as e:
+            # Expected network failures: no traceback needed
+            logger.warning("[Mealie Test] Network error: {}: {}", type(e).__name__, e)
+            return {
+                "success": False,
+                "message": f"Network error: {str(e)}",
+            }
+        except ValueError as e:
+            # Malformed JSON from the server (e.g. a proxy error page)
+            logger.warning("[Mealie Test] Invalid response from {}: {}", mealie_url, e)
+            return {
+                "success": False,
+                "message": f"Invalid response from {mealie_url}. Is this a Mealie server?",
+            }
         except Exception as e:
-            logger.exception(f"[Mealie Test] Unexpected error: {e}")
+            logger.exception("[Mealie Test] Unexpected error: {}", e)
             return {
                 "success": False,
                 "message": f"Error: {str(e)}",
@@ -899,66 +1340,52 @@ async def handle_plugin_config_update(
     session: Any,
 ) -> dict[str, Any] | None:
     """Handle Mealie plugin configuration update and instance management."""
+    global _CONFIG_VERSION
+
     if type_id != "mealie":
         return None
 
     def normalize_config(c: dict[str, Any]) -> dict[str, Any]:
         """Normalize config values."""
-        mealie_url = extract_config_value(c, "mealie_url", default="", converter=to_str)
-        mealie_url = mealie_url.rstrip("/") if mealie_url else ""
-
-        api_token = extract_config_value(c, "api_token", default="", converter=to_str)
-        api_token = api_token.strip() if api_token else ""
+        normalized: dict[str, Any] = {}
+        for key, default, converter, transform in CONFIG_FIELDS:
+            value = extract_config_value(c, key, default=default, converter=converter)
+            if transform:
+                value = transform(value)
+            # Unset optional settings are persisted as "" rather than None
+            normalized[key] = "" if value is None else value
+
+        # The settings form does not send the discovered endpoint; keep it on save
+        normalized["mealplan_endpoint"] = (
+            _known_endpoint(normalized["mealie_url"], normalized["mealplan_endpoint"]) or ""
+        )
 
         # Log token status (without exposing actual token)
-        token_status = "present" if api_token else "missing"
-        token_length = len(api_token) if api_token else 0
         logger.info(
-            f"[Mealie] Config update received - URL: {mealie_url}, "
-            f"API token: {token_status} (length: {token_length})"
+            "[Mealie] Config update received - URL: {}, API token: {} (length: {})",
+            normalized["mealie_url"],
+            "present" if normalized["api_token"] else "missing",
+            len(normalized["api_token"]),
         )
 
         # Also check if we can get the token from db_type.common_config_schema as fallback
-        if not api_token and db_type and db_type.common_config_schema:
+        if not normalized["api_token"] and db_type and db_type.common_config_schema:
             fallback_token = db_type.common_config_schema.get("api_token", "")
             if fallback_token:
-                api_token = str(fallback_token).strip()
+                normalized["api_token"] = str(fallback_token).strip()
                 logger.info(
-                    f"[Mealie] Retrieved API token from db_type.common_config_schema "
-                    f"(length: {len(api_token)})"
+                    "[Mealie] Retrieved API token from db_type.common_config_schema (length: {})",
+                    len(normalized["api_token"]),
                 )
 
-        group_id = extract_config_value(c, "group_id", default="", converter=to_str)
-        group_id = group_id.strip() if group_id else ""
-
-        return {
-            "mealie_url": mealie_url,
-            "api_token": api_token,
-            "group_id": group_id,
-            "days_ahead": extract_config_value(c, "days_ahead", default=7, converter=to_int),
-            "display_order": extract_config_value(c, "display_order", default=0, converter=to_int),
-            "fullscreen": extract_config_value(c, "fullscreen", default=False, converter=to_bool),
-        }
+        return normalized
 
     def validate_config(c: dict[str, Any]) -> bool:
         """Validate config before creating/updating instance."""
-        # Check required fields
-        mealie_url = c.get("mealie_url", "")
-        api_token = c.get("api_token", "")
-
-        if not mealie_url or not mealie_url.strip():
-            logger.info("[Mealie] Skipping instance creation - missing URL")
-            return False
-        if not api_token or not api_token.strip():
-            logger.info("[Mealie] Skipping instance creation - missing API token")
+        error = _connection_config_error(c.get("mealie_url", ""), c.get("api_token", ""))
+        if error:
+            logger.info("[Mealie] Skipping instance creation - {}", error)
             return False
-
-        # URL must be valid
-        url = mealie_url.strip()
-        if not url.startswith("http://") and not url.startswith("https://"):
-            logger.info("[Mealie] Skipping instance creation - invalid URL")
-            return False
-
         return True
 
     manager_config = build_service_manager_config(
@@ -970,6 +1397,9 @@ async def handle_plugin_config_update(
         default_instance_name="Mealie Meal Plan",
     )
 
-    return await handle_plugin_config_update_generic(
+    result = await handle_plugin_config_update_generic(
         type_id, config, enabled, db_type, session, manager_config
     )
+    # Let running instances pick up the new config on their next fetch
+    _CONFIG_VERSION += 1
+    return result
@@ -5,6 +5,7 @@ These tests should be run from the backend directory:
     pytest ../calvin-plugins/mealie/test_mealie.py
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, timedelta
 
@@ -44,6 +45,22 @@ except ImportError as e:
     pytest.skip(f"Backend dependencies not available: {e}", allow_module_level=True)
 
 
+@pytest.fixture(autouse=True)
+def clear_test_cache():
+    """Reset the module-level caches and client users between tests."""
+    mealie_module._TEST_CACHE.clear()
+    mealie_module._USER_ETAGS.clear()
+    mealie_module._MEAL_PLAN_CACHE.clear()
+    mealie_module._DISCOVERED_ENDPOINTS.clear()
+    mealie_module._CLIENT_USERS.clear()
+    yield
+    mealie_module._TEST_CACHE.clear()
+    mealie_module._USER_ETAGS.clear()
+    mealie_module._MEAL_PLAN_CACHE.clear()
+    mealie_module._DISCOVERED_ENDPOINTS.clear()
+    mealie_module._CLIENT_USERS.clear()
+
+
 @pytest.fixture
 def mealie_plugin():
     """Create a MealieServicePlugin instance."""
@@ -89,6 +106,49 @@ class TestMealieServicePlugin:
         assert mealie_plugin.display_order == 0
         assert mealie_plugin.fullscreen is False
 
+    def test_env_timeout_falls_back_on_invalid_values(self, monkeypatch):
+        """Test that timeout overrides are parsed defensively instead of failing import."""
+        monkeypatch.delenv("MEALIE_TEST_TIMEOUT", raising=False)
+        assert mealie_module._env_timeout("MEALIE_TEST_TIMEOUT", 3.0) == 3.0
+
+        monkeypatch.setenv("MEALIE_TEST_TIMEOUT", "12.5")
+        assert mealie_module._env_timeout("MEALIE_TEST_TIMEOUT", 3.0) == 12.5
+
+        for invalid in ("fast", "", "-1", "0", "nan"):
+            monkeypatch.setenv("MEALIE_TEST_TIMEOUT", invalid)
+            assert mealie_module._env_timeout("MEALIE_TEST_TIMEOUT", 3.0) == 3.0
+
+    @pytest.mark.asyncio
+    async def test_retry_retries_transient_failures(self):
+        """Test that connect errors and 5xx answers are retried with backoff."""
+        ok = MagicMock(status_code=200)
+        op = AsyncMock(side_effect=[httpx.ConnectError("down"), MagicMock(status_code=503), ok])
+        with patch.object(mealie_module.asyncio, "sleep", new_callable=AsyncMock) as sleep:
+            assert await mealie_module._retry(op) is ok
+        assert op.await_count == 3
+        assert sleep.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_retry_does_not_retry_read_timeout(self):
+        """Test that a read timeout from a slow server is raised after one attempt."""
+        op = AsyncMock(side_effect=httpx.ReadTimeout("slow"))
+        with patch.object(mealie_module.asyncio, "sleep", new_callable=AsyncMock) as sleep:
+            with pytest.raises(httpx.ReadTimeout):
+                await mealie_module._retry(op)
+        op.assert_awaited_once()
+        sleep.assert_not_awaited()
+
+    def test_init_normalizes_url_and_token(self):
+        """Test that the URL and token are stored normalized."""
+        plugin = MealieServicePlugin(
+            plugin_id="mealie-instance",
+            name="Mealie Meal Plan",
+            mealie_url=" http://mealie.local:9000/ ",
+            api_token="  test-api-token\n",
+        )
+        assert plugin.mealie_url == "http://mealie.local:9000"
+        assert plugin.api_token == "test-api-token"
+
     def test_init_with_group_id(self):
         """Test plugin initialization with group ID."""
         plugin = MealieServicePlugin(
@@ -227,6 +287,163 @@ class TestMealieServicePlugin:
             result = await mealie_plugin._fetch_meal_plan()
             assert "error" in result
 
+    @pytest.mark.asyncio
+    async def test_fetch_meal_plan_remembers_working_endpoint(self, mealie_plugin):
+        """Test that the endpoint that answered is tried first on the next fetch."""
+
+        async def get(url, **kwargs):
+            status = 200 if url.endswith("/api/meal-plans") else 404
+            response = MagicMock(status_code=status)
+            response.json.return_value = {"items": []}
+            return response
+
+        client = MagicMock()
+        client.get = AsyncMock(side_effect=get)
+        mealie_plugin._client = client
+
+        await mealie_plugin._fetch_meal_plan()
+        # Without a group ID the households endpoint is only requested once
+        assert client.get.await_count == 3
+        assert mealie_plugin.mealplan_endpoint == "/api/meal-plans"
+        assert mealie_plugin.get_config()["mealplan_endpoint"] == "/api/meal-plans"
+
+        client.get.reset_mock()
+        await mealie_plugin._fetch_meal_plan()
+        client.get.assert_awaited_once()
+        assert client.get.await_args.args[0].endswith("/api/meal-plans")
+
+    @pytest.mark.asyncio
+    async def test_fetch_meal_plan_prefers_earlier_endpoint(self, mealie_plugin):
+        """Test that concurrent probes still honour endpoint order over speed."""
+
+        async def get(url, **kwargs):
+            if url.endswith("/api/households/mealplans"):
+                await asyncio.sleep(0.01)
+            response = MagicMock(status_code=200)
+            response.json.return_value = {"items": [], "source": url}
+            return response
+
+        client = MagicMock()
+        client.get = AsyncMock(side_effect=get)
+        mealie_plugin._client = client
+
+        result = await mealie_plugin._fetch_meal_plan()
+        assert result["source"].endswith("/api/households/mealplans")
+        assert mealie_plugin.mealplan_endpoint == "/api/households/mealplans"
+
+    @pytest.mark.asyncio
+    async def test_fetch_meal_plan_date_range(self, mealie_plugin):
+        """Test date parsing for plain dates, timestamps, and invalid values."""
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"items": []}
+        client = MagicMock()
+        client.get = AsyncMock(return_value=response)
+        mealie_plugin._client = client
+
+        await mealie_plugin._fetch_meal_plan("2024-01-01", "2024-01-05T12:00:00")
+        params = client.get.await_args.kwargs["params"]
+        assert params == {"start_date": "2024-01-01", "end_date": "2024-01-05"}
+
+        await mealie_plugin._fetch_meal_plan("not-a-date", None)
+        params = client.get.await_args.kwargs["params"]
+        today = datetime.now().date()
+        assert params["start_date"] == today.isoformat()
+        assert params["end_date"] == (today + timedelta(days=7)).isoformat()
+
+    @pytest.mark.asyncio
+    async def test_fetch_service_data_serves_fresh_cache(self, mealie_plugin):
+        """Test that repeat fetches within the fresh window skip the Mealie API."""
+        fetch = AsyncMock(return_value={"items": [{"date": "2024-01-01"}]})
+        with (
+            patch.object(mealie_plugin, "_reload_config_from_db", AsyncMock()),
+            patch.object(mealie_plugin, "_fetch_meal_plan", fetch),
+        ):
+            first = await mealie_plugin.fetch_service_data()
+            second = await mealie_plugin.fetch_service_data()
+
+        assert second == first
+        assert first["_metadata"]["mealie_url"] == "http://mealie.local:9000"
+        fetch.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_fetch_service_data_refreshes_stale_cache_in_background(self, mealie_plugin):
+        """Test that stale entries are served immediately and refreshed afterwards."""
+        fetch = AsyncMock(side_effect=[{"items": ["old"]}, {"items": ["new"]}])
+        with (
+            patch.object(mealie_plugin, "_reload_config_from_db", AsyncMock()),
+            patch.object(mealie_plugin, "_fetch_meal_plan", fetch),
+        ):
+            await mealie_plugin.fetch_service_data()
+            key = next(iter(mealie_module._MEAL_PLAN_CACHE))
+            stored_at, data = mealie_module._MEAL_PLAN_CACHE[key]
+            stale_at = stored_at - mealie_module._MEAL_PLAN_FRESH_TTL - 1
+            mealie_module._MEAL_PLAN_CACHE[key] = (stale_at, data)
+
+            stale = await mealie_plugin.fetch_service_data()
+            assert stale["items"] == ["old"]
+            await mealie_module._MEAL_PLAN_REFRESHES[key]
+
+            fresh = await mealie_plugin.fetch_service_data()
+            assert fresh["items"] == ["new"]
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_fetch_service_data_returns_copies(self, mealie_plugin):
+        """Test that callers changing their result do not change what others get."""
+        fetch = AsyncMock(return_value={"items": [{"date": "2024-01-01"}]})
+        with (
+            patch.object(mealie_plugin, "_reload_config_from_db", AsyncMock()),
+            patch.object(mealie_plugin, "_fetch_meal_plan", fetch),
+        ):
+            first = await mealie_plugin.fetch_service_data()
+            first["items"].clear()
+            first["_metadata"]["mealie_url"] = "changed"
+            second = await mealie_plugin.fetch_service_data()
+            second["items"].append("extra")
+            third = await mealie_plugin.fetch_service_data()
+
+        assert third["items"] == [{"date": "2024-01-01"}]
+        assert third["_metadata"]["mealie_url"] == "http://mealie.local:9000"
+
+    @pytest.mark.asyncio
+    async def test_refresh_does_not_cache_after_config_change(self, mealie_plugin):
+        """Test that a refresh still running when the cache is dropped does not write back."""
+        release = asyncio.Event()
+
+        async def slow_fetch(start_date=None, end_date=None):
+            await release.wait()
+            return {"items": ["old config"]}
+
+        with (
+            patch.object(mealie_plugin, "_reload_config_from_db", AsyncMock()),
+            patch.object(mealie_plugin, "_fetch_meal_plan", side_effect=slow_fetch),
+        ):
+            pending = asyncio.create_task(mealie_plugin.fetch_service_data())
+            await asyncio.sleep(0)
+            mealie_module._forget_meal_plans(mealie_plugin.plugin_id)
+            release.set()
+            await pending
+
+        assert mealie_module._MEAL_PLAN_CACHE == {}
+
+    @pytest.mark.asyncio
+    async def test_fetch_service_data_does_not_cache_errors(self, mealie_plugin):
+        """Test that error responses are fetched again on the next call."""
+        fetch = AsyncMock(return_value={"items": [], "error": "HTTP error: 500"})
+        with (
+            patch.object(mealie_plugin, "_reload_config_from_db", AsyncMock()),
+            patch.object(mealie_plugin, "_fetch_meal_plan", fetch),
+        ):
+            await mealie_plugin.fetch_service_data()
+            await mealie_plugin.fetch_service_data()
+        assert fetch.await_count == 2
+
+    def test_response_snippet_decodes_only_logged_bytes(self):
+        """Test that error body snippets are truncated before decoding."""
+        response = httpx.Response(500, content=("é" * 1000).encode())
+        assert mealie_module._response_snippet(response, limit=4) == "éé"
+        assert mealie_module._response_snippet(httpx.Response(500, text="oops")) == "oops"
+
     @pytest.mark.asyncio
     async def test_validate_config_valid(self, mealie_plugin):
         """Test config validation with valid config."""
@@ -292,6 +509,256 @@ class TestMealieServicePlugin:
         assert result["success"] is False
         assert "required" in result["message"].lower()
 
+    @pytest.mark.asyncio
+    async def test_test_type_config_uses_shared_client(self):
+        """Test that the connection test probes through the shared pooled client."""
+
+        def respond(url, **kwargs):
+            response = MagicMock()
+            if url.endswith("/api/users/self"):
+                response.status_code = 200
+                response.json.return_value = {"id": "1", "username": "chef"}
+            elif url.endswith("/api/meal-plans"):
+                assert kwargs["params"]["perPage"] == 1
+                response.status_code = 200
+                response.json.return_value = {"items": [{"id": 1}], "total": 2}
+            elif url.endswith("/api/recipes"):
+                response.status_code = 200
+            else:
+                response.status_code = 404
+            return response
+
+        client = MagicMock()
+        client.get = AsyncMock(side_effect=respond)
+        client.head = AsyncMock(return_value=MagicMock(status_code=200))
+        with patch.object(mealie_module, "_get_client", AsyncMock(return_value=client)):
+            result = await MealieServicePlugin.test_type_config(
+                {"mealie_url": "http://mealie.local:9000/", "api_token": "test-token"}
+            )
+
+        assert result["success"] is True
+        assert "user: chef" in result["message"]
+        assert "/api/meal-plans: 2 items found" in result["message"]
+        assert result["discovered_endpoint"] == "/api/meal-plans"
+        # Meal plan access already proves the API works
+        client.head.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_test_type_config_checks_recipes_when_meal_plans_fail(self):
+        """Test that the recipes check only runs when no meal plan endpoint answers."""
+
+        def respond(url, **kwargs):
+            response = MagicMock()
+            if url.endswith("/api/users/self"):
+                response.status_code = 200
+                response.json.return_value = {"id": "1", "username": "chef"}
+            elif url.endswith("/api/recipes"):
+                assert kwargs["params"] == {"perPage": 1}
+                response.status_code = 200
+            else:
+                response.status_code = 404
+            return response
+
+        client = MagicMock()
+        client.get = AsyncMock(side_effect=respond)
+        # Servers rejecting HEAD fall back to a minimal GET
+        client.head = AsyncMock(return_value=MagicMock(status_code=405))
+        with patch.object(mealie_module, "_get_client", AsyncMock(return_value=client)):
+            result = await MealieServicePlugin.test_type_config(
+                {"mealie_url": "http://mealie.local:9000", "api_token": "test-token"}
+            )
+
+        assert result["success"] is False
+        assert "Could not access meal plan endpoint" in result["message"]
+        assert "Recipes API accessible" in result["message"]
+        client.head.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_test_type_config_caches_success(self):
+        """Test that repeat connection tests are served from the short-lived cache."""
+        response = MagicMock()
+        response.status_code = 200
+        response.json.return_value = {"id": "user-1", "username": "chef", "items": []}
+        client = MagicMock()
+        client.get = AsyncMock(return_value=response)
+        config = {"mealie_url": "http://mealie.local:9000", "api_token": "test-token"}
+
+        with patch.object(mealie_module, "_get_client", AsyncMock(return_value=client)):
+            first = await MealieServicePlugin.test_type_config(config)
+            calls = client.get.await_count
+            second = await MealieServicePlugin.test_type_config(config)
+
+        assert first["success"] is True
+        assert second == first
+        assert client.get.await_count == calls
+        assert all("test-token" not in key for key in mealie_module._TEST_CACHE)
+
+    @pytest.mark.asyncio
+    async def test_test_type_config_cached_result_is_a_copy(self):
+        """Test that mutating a returned result does not change later cached answers."""
+        response = MagicMock()
+        response.status_code = 200
+        response.json.return_value = {"id": "user-1", "username": "chef", "items": []}
+        client = MagicMock()
+        client.get = AsyncMock(return_value=response)
+        config = {"mealie_url": "http://mealie.local:9000", "api_token": "test-token"}
+
+        with patch.object(mealie_module, "_get_client", AsyncMock(return_value=client)):
+            first = await MealieServicePlugin.test_type_config(config)
+            message = first["message"]
+            first["message"] = "MUTATED"
+            second = await MealieServicePlugin.test_type_config(config)
+            second["message"] = "MUTATED"
+            third = await MealieServicePlugin.test_type_config(config)
+
+        assert second is not first
+        assert third["message"] == message
+
+    @pytest.mark.asyncio
+    async def test_test_type_config_tries_remembered_endpoint_first(self):
+        """Test that a remembered meal plan endpoint is probed alone before the others."""
+        requested = []
+
+        def respond(url, **kwargs):
+            requested.append(url)
+            response = MagicMock()
+            response.status_code = 200
+            response.json.return_value = {"id": "1", "username": "chef", "items": []}
+            return response
+
+        client = MagicMock()
+        client.get = AsyncMock(side_effect=respond)
+        with patch.object(mealie_module, "_get_client", AsyncMock(return_value=client)):
+            result = await MealieServicePlugin.test_type_config(
+                {
+                    "mealie_url": "http://mealie.local:9000",
+                    "api_token": "test-token",
+                    "mealplan_endpoint": "/api/mealplan",
+                }
+            )
+
+        assert result["success"] is True
+        assert result["discovered_endpoint"] == "/api/mealplan"
+        assert not any(url.endswith("/api/households/mealplans") for url in requested)
+
+    @pytest.mark.asyncio
+    async def test_test_type_config_reuses_discovered_endpoint(self):
+        """Test that a form config without mealplan_endpoint probes the discovered one only."""
+        requested = []
+
+        def respond(url, **kwargs):
+            requested.append(url)
+            response = MagicMock()
+            if url.endswith(("/api/users/self", "/api/mealplan")):
+                response.status_code = 200
+                response.json.return_value = {"id": "1", "username": "chef", "items": []}
+            else:
+                response.status_code = 404
+            return response
+
+        client = MagicMock()
+        client.get = AsyncMock(side_effect=respond)
+        config = {"mealie_url": "http://mealie.local:9000", "api_token": "test-token"}
+        with patch.object(mealie_module, "_get_client", AsyncMock(return_value=client)):
+            first = await MealieServicePlugin.test_type_config(config)
+            mealie_module._TEST_CACHE.clear()
+            requested.clear()
+            second = await MealieServicePlugin.test_type_config(config)
+
+        assert first["discovered_endpoint"] == second["discovered_endpoint"] == "/api/mealplan"
+        meal_plan_requests = [url for url in requested if not url.endswith("/api/users/self")]
+        assert meal_plan_requests == ["http://mealie.local:9000/api/mealplan"]
+
+    @pytest.mark.asyncio
+    async def test_test_type_config_prefers_earlier_endpoint(self):
+        """Test that a fast 403 from a later endpoint does not beat an earlier 200."""
+
+        async def respond(url, **kwargs):
+            response = MagicMock()
+            if url.endswith("/api/users/self"):
+                response.status_code = 200
+                response.json.return_value = {"id": "1", "username": "chef"}
+            elif url.endswith("/api/households/mealplans"):
+                await asyncio.sleep(0.01)
+                response.status_code = 200
+                response.json.return_value = {"items": [], "total": 0}
+            else:
+                response.status_code = 403
+            return response
+
+        client = MagicMock()
+        client.get = AsyncMock(side_effect=respond)
+        with patch.object(mealie_module, "_get_client", AsyncMock(return_value=client)):
+            result = await MealieServicePlugin.test_type_config(
+                {"mealie_url": "http://mealie.local:9000", "api_token": "test-token"}
+            )
+
+        assert result["success"] is True
+        assert result["discovered_endpoint"] == "/api/households/mealplans"
+
+    @pytest.mark.asyncio
+    async def test_test_type_config_revalidates_user_with_etag(self):
+        """Test that a repeat auth check sends If-None-Match and reuses the user on 304."""
+        sent_headers = []
+
+        def respond(url, headers=None, **kwargs):
+            response = MagicMock()
+            if url.endswith("/api/users/self"):
+                sent_headers.append(headers)
+                if "If-None-Match" in headers:
+                    response.status_code = 304
+                    response.json.side_effect = AssertionError("304 has no body")
+                else:
+                    response.status_code = 200
+                    response.headers = {"etag": '"v1"'}
+                    response.json.return_value = {"id": "1", "username": "chef"}
+            else:
+                response.status_code = 200
+                response.json.return_value = []
+            return response
+
+        client = MagicMock()
+        client.get = AsyncMock(side_effect=respond)
+        config = {"mealie_url": "http://mealie.local:9000", "api_token": "test-token"}
+
+        with patch.object(mealie_module, "_get_client", AsyncMock(return_value=client)):
+            await MealieServicePlugin.test_type_config(config)
+            mealie_module._TEST_CACHE.clear()
+            result = await MealieServicePlugin.test_type_config(config)
+
+        assert sent_headers[-1]["If-None-Match"] == '"v1"'
+        assert result["success"] is True
+        assert "user: chef" in result["message"]
+
+    @pytest.mark.asyncio
+    async def test_test_type_config_cancels_probes_on_auth_failure(self):
+        """Test that a 401 from the auth check cancels the in-flight probes."""
+        probe_started = asyncio.Event()
+        probe_cancelled = asyncio.Event()
+
+        async def respond(url, **kwargs):
+            if url.endswith("/api/users/self"):
+                await probe_started.wait()
+                return MagicMock(status_code=401)
+            probe_started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                probe_cancelled.set()
+                raise
+
+        client = MagicMock()
+        client.get = AsyncMock(side_effect=respond)
+        client.head = AsyncMock(side_effect=respond)
+        with patch.object(mealie_module, "_get_client", AsyncMock(return_value=client)):
+            result = await MealieServicePlugin.test_type_config(
+                {"mealie_url": "http://mealie.local:9000", "api_token": "bad-token"}
+            )
+
+        assert result["success"] is False
+        assert "Authentication failed" in result["message"]
+        assert probe_cancelled.is_set()
+
     @pytest.mark.asyncio
     async def test_validate_config_invalid_scheme(self, mealie_plugin):
         """Test config validation with unsupported URL scheme."""
@@ -389,6 +856,75 @@ class TestMealieServicePlugin:
         assert mealie_plugin.mealie_url == original_url
         assert mealie_plugin.days_ahead == 10
 
+    @pytest.mark.asyncio
+    async def test_configure_keeps_client_when_connection_unchanged(self, mealie_plugin):
+        """Test that non-connection settings do not reinitialize the plugin."""
+        await mealie_plugin.initialize()
+
+        with patch.object(mealie_plugin, "initialize", AsyncMock()) as initialize:
+            await mealie_plugin.configure({"days_ahead": 10, "fullscreen": True})
+            initialize.assert_not_awaited()
+
+        await mealie_plugin.configure({"api_token": "rotated-token"})
+        assert mealie_plugin._auth_headers == {"Authorization": "Bearer rotated-token"}
+
+    @pytest.mark.asyncio
+    async def test_reload_config_from_db_skips_until_config_changes(self, mealie_plugin):
+        """Test that the DB config is only re-read after a config update."""
+        db_plugin = MagicMock(config={"api_token": "test-api-token"})
+        get_or_none = AsyncMock(return_value=db_plugin)
+
+        with patch("app.models.db_models.PluginDB.objects.get_or_none", get_or_none):
+            await mealie_plugin._reload_config_from_db()
+            await mealie_plugin._reload_config_from_db()
+            assert get_or_none.await_count == 1
+
+            with patch.object(mealie_module, "_CONFIG_VERSION", mealie_module._CONFIG_VERSION + 1):
+                await mealie_plugin._reload_config_from_db()
+            assert get_or_none.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_instances_share_pooled_client(self, mealie_plugin):
+        """Test that instances share one pooled client, closed by the last cleanup."""
+        other = MealieServicePlugin(
+            plugin_id="mealie-other",
+            name="Other Mealie",
+            mealie_url="https://other.example.com",
+            api_token="other-token",
+        )
+        await mealie_plugin.initialize()
+        await other.initialize()
+        assert mealie_plugin._client is other._client
+
+        shared = other._client
+        await other.cleanup()
+        assert not shared.is_closed
+
+        await mealie_plugin.cleanup()
+        assert shared.is_closed
+        assert await mealie_module._get_client() is not shared
+
+    @pytest.mark.asyncio
+    async def test_get_client_closes_clients_of_closed_loops(self):
+        """Test that a client left behind by a closed event loop is closed, not just dropped."""
+        closed_loop = MagicMock()
+        closed_loop.is_closed.return_value = True
+        stale = MagicMock()
+        stale.aclose = AsyncMock(side_effect=RuntimeError("Event loop is closed"))
+        loop = asyncio.get_running_loop()
+        current = mealie_module._CLIENT_BY_LOOP.pop(loop, None)
+        mealie_module._CLIENT_BY_LOOP[closed_loop] = stale
+        try:
+            client = await mealie_module._get_client()
+        finally:
+            mealie_module._CLIENT_BY_LOOP.pop(closed_loop, None)
+            if current is not None:
+                await current.aclose()
+
+        stale.aclose.assert_awaited_once()
+        assert closed_loop not in mealie_module._CLIENT_BY_LOOP
+        assert mealie_module._CLIENT_BY_LOOP[loop] is client
+
 
 @pytest.mark.asyncio
 class TestMealiePluginHooks:
@@ -416,3 +952,72 @@ class TestMealiePluginHooks:
             "Run from backend directory: "
             "cd backend && pytest tests/unit/test_plugin_hooks.py"
         )
+
+    async def test_handle_plugin_config_update_normalizes_config(self):
+        """Test the config normalization passed to the generic instance manager."""
+        build = MagicMock(return_value="manager-config")
+        with (
+            patch.object(mealie_module, "build_service_manager_config", build),
+            patch.object(
+                mealie_module, "handle_plugin_config_update_generic", AsyncMock(return_value={})
+            ),
+        ):
+            await mealie_module.handle_plugin_config_update("mealie", {}, True, None, None)
+
+        normalize = build.call_args.kwargs["extra_normalize"]
+        normalized = normalize(
+            {
+                "mealie_url": " http://mealie.local:9000/ ",
+                "api_token": " token ",
+                "days_ahead": "10",
+                "mealplan_endpoint": "/not/an/endpoint",
+            }
+        )
+        assert normalized == {
+            "mealie_url": "http://mealie.local:9000",
+            "api_token": "token",
+            "group_id": "",
+            "days_ahead": 10,
+            "display_order": 0,
+            "fullscreen": False,
+            "mealplan_endpoint": "",
+        }
+
+    async def test_save_keeps_discovered_endpoint(self):
+        """Test that saving settings without the endpoint keeps the discovered one."""
+        response = MagicMock()
+        response.status_code = 200
+        response.json.return_value = {"id": "1", "username": "chef", "items": []}
+        client = MagicMock()
+        client.get = AsyncMock(return_value=response)
+        ui_config = {"mealie_url": "http://mealie.local:9000", "api_token": "test-token"}
+
+        with patch.object(mealie_module, "_get_client", AsyncMock(return_value=client)):
+            result = await MealieServicePlugin.test_type_config(ui_config)
+        assert result["discovered_endpoint"] == "/api/households/mealplans"
+
+        # Save from the settings form, which does not send mealplan_endpoint
+        build = MagicMock(return_value="manager-config")
+        with (
+            patch.object(mealie_module, "build_service_manager_config", build),
+            patch.object(
+                mealie_module, "handle_plugin_config_update_generic", AsyncMock(return_value={})
+            ),
+        ):
+            await mealie_module.handle_plugin_config_update("mealie", ui_config, True, None, None)
+        stored = build.call_args.kwargs["extra_normalize"](ui_config)
+        assert stored["mealplan_endpoint"] == "/api/households/mealplans"
+
+        # Reloading an instance from the stored config keeps the endpoint, and so
+        # does a later reconfigure from a config that lacks it
+        plugin = MealieServicePlugin(
+            plugin_id="mealie-instance",
+            name="Mealie Meal Plan",
+            mealie_url=stored["mealie_url"],
+            api_token=stored["api_token"],
+            mealplan_endpoint=stored["mealplan_endpoint"],
+        )
+        assert plugin.mealplan_endpoint == "/api/households/mealplans"
+        with patch.object(mealie_module, "_get_client", AsyncMock(return_value=client)):
+            await plugin.configure({**ui_config, "mealplan_endpoint": ""})
+        assert plugin.mealplan_endpoint == "/api/households/mealplans"
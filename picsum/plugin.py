@@ -1,6 +1,10 @@
 """Picsum Photos image plugin (no API key required)."""
 
+import asyncio
 import random
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable
 from datetime import datetime
 from typing import Any
 
@@ -14,17 +18,78 @@ from app.plugins.sdk.image import (
     build_image_manager_config,
     build_image_plugin_metadata,
     create_image_plugin_instance,
-    fetch_image_data,
 )
 from app.plugins.utils.config import extract_config_value, to_int
 from app.plugins.utils.instance_manager import handle_plugin_config_update_generic
 from app.plugins.utils.scan_cache import load_scan_cache, save_scan_cache
 
+# Optional HTTP/2 support, detected the same way as in the Mealie plugin
+try:
+    import h2  # noqa: F401
+
+    _H2_AVAILABLE = True
+except ImportError:
+    _H2_AVAILABLE = False
+
 
 IMAGE_FIELDS = (
     ImageConfigField("count", default=30, converter=to_int),
 )
 
+# Chunk size for stream_image_data
+STREAM_CHUNK_SIZE = 65536
+
+# Upper bound on concurrent downloads in get_image_data_many, to stay polite to Picsum
+MAX_CONCURRENT_DOWNLOADS = 16
+
+# Connection pool size for the plugin's HTTP client
+PICSUM_MAX_CONNECTIONS = 32
+
+# Stage-specific HTTP timeouts (seconds); a stalled body gives up well before 30s
+PICSUM_CONNECT_TIMEOUT = 5.0
+PICSUM_READ_TIMEOUT = 15.0
+PICSUM_WRITE_TIMEOUT = 5.0
+PICSUM_POOL_TIMEOUT = 5.0
+
+# Downloaded images kept in memory (least recently used evicted); ~100 KB each at 800x600
+IMAGE_DATA_CACHE_SIZE = 32
+
+# Images downloaded in the background after initialize, so the first render is warm
+PREFETCH_COUNT = 1
+
+
+# Kept in step with _retry in the Mealie plugin; each plugin ships on its own, so the
+# helper is copied rather than shared. The backoff is shorter (base 0.1s, cap 1.0s)
+# because a failed list request falls back to the current selection, so a long wait
+# buys little.
+async def _retry(
+    op: Callable[[], Awaitable[httpx.Response]],
+    *,
+    attempts: int = 3,
+    base: float = 0.1,
+    cap: float = 1.0,
+) -> httpx.Response:
+    """
+    Run an HTTP request, retrying transient failures with full-jitter backoff.
+
+    Transport errors and 5xx responses are retried; any other status is returned
+    immediately. A read timeout means the server is up but slow, so it is
+    re-raised at once rather than waiting out several more. After the last
+    attempt the transport error is re-raised or the final 5xx response is returned.
+    """
+    for attempt in range(attempts - 1):
+        try:
+            response = await op()
+        except httpx.ReadTimeout:
+            raise
+        except httpx.TransportError:
+            pass
+        else:
+            if response.status_code < 500:
+                return response
+        await asyncio.sleep(random.uniform(0, min(cap, base * 2**attempt)))
+    return await op()
+
 
 class PicsumImagePlugin(ImagePlugin):
     """Picsum Photos image plugin for fetching random images without API key."""
@@ -73,22 +138,85 @@ class PicsumImagePlugin(ImagePlugin):
         super().__init__(plugin_id, name, enabled)
         self.count = count
         self.base_url = "https://picsum.photos"
-        self._images: list[dict[str, Any]] = []
-        self._last_scan: datetime | None = None
+        self._list_url = f"{self.base_url}/v2/list"
+        self._fetch_limit = self._compute_fetch_limit()
+        # Current selection keyed by image ID, in display order
+        self._images_by_id: dict[str, dict[str, Any]] = {}
+        # time.monotonic() of the last successful scan, immune to wall-clock jumps
+        self._last_scan_monotonic: float | None = None
         self._scan_interval = 3600  # Rescan every hour
+        self._client: httpx.AsyncClient | None = None
+        # Lets concurrent callers of a stale selection share a single fetch
+        self._scan_lock = asyncio.Lock()
+        # Image bytes by image ID, least recently used first; a Picsum ID always
+        # serves the same photo
+        self._image_data: OrderedDict[str, bytes] = OrderedDict()
+        self._prefetch_task: asyncio.Task | None = None
+        # ETag and photo list per (page, limit) for conditional /v2/list requests
+        self._list_pages: dict[tuple[int, int], tuple[str, list[dict[str, Any]]]] = {}
+
+    def _compute_fetch_limit(self) -> int:
+        """Return the /v2/list page size for the configured count."""
+        # Fetch 2x count or at least 50 so shuffling has enough to pick from,
+        # capped at the Picsum API limit of 100 per page
+        return min(max(self.count * 2, 50), 100)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the plugin's HTTP client, creating it on first use."""
+        if self._client is None:
+            # Kept for the plugin's lifetime so rescans reuse the connection. HTTP/2
+            # multiplexes concurrent image requests over it; httpx falls back to
+            # HTTP/1.1 when h2 is missing or the server doesn't negotiate it
+            self._client = httpx.AsyncClient(
+                http2=_H2_AVAILABLE,
+                limits=httpx.Limits(max_connections=PICSUM_MAX_CONNECTIONS),
+                timeout=httpx.Timeout(
+                    connect=PICSUM_CONNECT_TIMEOUT,
+                    read=PICSUM_READ_TIMEOUT,
+                    write=PICSUM_WRITE_TIMEOUT,
+                    pool=PICSUM_POOL_TIMEOUT,
+                ),
+            )
+        return self._client
 
     async def initialize(self) -> None:
         """Initialize the plugin."""
         cached_images, cached_time = load_scan_cache(self.plugin_id)
         if cached_images:
-            self._images = cached_images
-            self._last_scan = cached_time
+            self._images_by_id = {image["id"]: image for image in cached_images}
+            if cached_time:
+                # The disk cache stores wall-clock time; carry its age over
+                age = (datetime.now() - cached_time).total_seconds()
+                self._last_scan_monotonic = time.monotonic() - age
         await self.scan_images()
+        await self._cancel_prefetch()
+        self._prefetch_task = asyncio.create_task(self.prefetch(PREFETCH_COUNT))
 
     async def cleanup(self) -> None:
         """Cleanup plugin resources."""
-        # Nothing to cleanup for API-based plugin
-        pass
+        await self._cancel_prefetch()
+        self._image_data.clear()
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+
+    async def _cancel_prefetch(self) -> None:
+        """Cancel a background prefetch that is still running."""
+        if self._prefetch_task:
+            self._prefetch_task.cancel()
+            await asyncio.gather(self._prefetch_task, return_exceptions=True)
+            self._prefetch_task = None
+
+    @property
+    def images(self) -> list[dict[str, Any]]:
+        """Current image selection, in display order."""
+        return list(self._images_by_id.values())
+
+    def _scan_is_fresh(self) -> bool:
+        """Return True if the last scan is recent enough to skip a rescan."""
+        if self._last_scan_monotonic is None:
+            return False
+        return time.monotonic() - self._last_scan_monotonic < self._scan_interval
 
     async def get_images(self) -> list[dict[str, Any]]:
         """
@@ -97,8 +225,9 @@ class PicsumImagePlugin(ImagePlugin):
         Returns:
             List of image metadata dictionaries
         """
-        await self.scan_images()
-        return self._images.copy()
+        if not self._scan_is_fresh():
+            return await self.scan_images()
+        return self.images
 
     async def get_image(self, image_id: str) -> dict[str, Any] | None:
         """
@@ -110,8 +239,10 @@ class PicsumImagePlugin(ImagePlugin):
         Returns:
             Image metadata dictionary or None if not found
         """
-        await self.scan_images()
-        return next((img for img in self._images if img["id"] == image_id), None)
+        # Only rescan when stale; building the full list just to index it is wasted work
+        if not self._scan_is_fresh():
+            await self.scan_images()
+        return self._images_by_id.get(image_id)
 
     async def get_image_data(self, image_id: str) -> bytes | None:
         """
@@ -123,20 +254,100 @@ class PicsumImagePlugin(ImagePlugin):
         Returns:
             Image file data as bytes or None if not found
         """
-        # Find the image to get its URL
+        # Serve cached bytes only for images that are still part of the selection
+        data = self._image_data.get(image_id)
+        if data is not None and image_id in self._images_by_id:
+            self._image_data.move_to_end(image_id)
+            return data
+
+        # Downloads share the plugin's pooled (HTTP/2 when available) client;
+        # an unknown image streams nothing
+        try:
+            data = b"".join([chunk async for chunk in self.stream_image_data(image_id)])
+        except httpx.HTTPStatusError as e:
+            logger.warning(
+                f"[Picsum] HTTP error fetching {image_id}: {e.response.status_code} - {e}"
+            )
+            return None
+        except httpx.HTTPError as e:
+            logger.warning(f"[Picsum] Request error fetching {image_id}: {e}")
+            return None
+
+        if not data:
+            return None
+        self._image_data[image_id] = data
+        self._image_data.move_to_end(image_id)
+        if len(self._image_data) > IMAGE_DATA_CACHE_SIZE:
+            self._image_data.popitem(last=False)
+        return data
+
+    async def prefetch(self, count: int = PREFETCH_COUNT) -> None:
+        """
+        Download the first images of the current selection into memory.
+
+        Args:
+            count: Number of images to download
+        """
+        image_ids = list(self._images_by_id)[:count]
+        if image_ids:
+            await self.get_image_data_many(image_ids)
+
+    async def stream_image_data(self, image_id: str) -> AsyncIterator[bytes]:
+        """
+        Stream image file data by ID without holding the whole image in memory.
+
+        Args:
+            image_id: Image identifier (Picsum photo ID)
+
+        Yields:
+            Chunks of image file data; nothing if the image is not found
+
+        Raises:
+            httpx.HTTPError: If the download fails
+        """
         image = await self.get_image(image_id)
         if not image:
-            return None
+            return
 
-        # Get the image URL
         image_url = image.get("url") or image.get("raw_url")
         if not image_url:
-            return None
+            return
+
+        # Picsum answers /id/... URLs with a redirect to the CDN
+        async with self._get_client().stream(
+            "GET", image_url, follow_redirects=True
+        ) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                yield chunk
+
+    async def get_image_data_many(self, image_ids: list[str]) -> list[bytes | None]:
+        """
+        Get file data for several images concurrently.
+
+        Args:
+            image_ids: Image identifiers (Picsum photo IDs)
+
+        Returns:
+            Image file data in the same order as image_ids, with None for images
+            that were not found or failed to download
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
 
-        return await fetch_image_data(
-            image_url,
-            plugin_name="Picsum",
+        async def download(image_id: str) -> bytes | None:
+            async with semaphore:
+                return await self.get_image_data(image_id)
+
+        results = await asyncio.gather(
+            *(download(image_id) for image_id in image_ids), return_exceptions=True
         )
+        data: list[bytes | None] = []
+        for image_id, result in zip(image_ids, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"[Picsum] Failed to download {image_id}: {result}")
+                result = None
+            data.append(result)
+        return data
 
     async def scan_images(self) -> list[dict[str, Any]]:
         """
@@ -146,11 +357,22 @@ class PicsumImagePlugin(ImagePlugin):
             List of image metadata dictionaries
         """
         # Check if we need to rescan (avoid too frequent API calls)
-        if self._last_scan:
-            time_since_scan = (datetime.now() - self._last_scan).total_seconds()
-            if time_since_scan < self._scan_interval:
-                return self._images.copy()
+        if self._scan_is_fresh():
+            return self.images
+
+        async with self._scan_lock:
+            # Another caller may have finished a scan while we waited for the lock
+            if self._scan_is_fresh():
+                return self.images
+            return await self._fetch_images()
+
+    async def _fetch_images(self) -> list[dict[str, Any]]:
+        """
+        Fetch a new random selection from Picsum Photos.
 
+        Returns:
+            List of image metadata dictionaries
+        """
         try:
             # Use Picsum Photos API to get list of images
             # The /v2/list endpoint returns a list of available images
@@ -158,42 +380,58 @@ class PicsumImagePlugin(ImagePlugin):
             # 1. Fetch from a random page (or multiple pages if needed)
             # 2. Shuffle the results client-side
             # 3. Take the requested count
-            
+
             # Picsum has ~1000 images, so ~10 pages with 100 per page
             # Pick a random page to get variety
             max_page = 10  # Approximate number of pages
             random_page = random.randint(1, max_page)
-            
+
             # Fetch more than needed to have enough for shuffling
-            fetch_limit = min(max(self.count * 2, 50), 100)  # Fetch 2x count or at least 50, max 100
-            
-            url = f"{self.base_url}/v2/list"
-            params = {
-                "page": random_page,
-                "limit": fetch_limit,  # Picsum API limit is 100 per page
-            }
-
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url, params=params)
+            fetch_limit = self._fetch_limit
+            params = {"page": random_page, "limit": fetch_limit}
+
+            # Revalidate a page we've seen before instead of downloading it again
+            page_key = (random_page, fetch_limit)
+            cached_page = self._list_pages.get(page_key)
+            headers = {"If-None-Match": cached_page[0]} if cached_page else None
+
+            client = self._get_client()
+            response = await _retry(
+                lambda: client.get(self._list_url, params=params, headers=headers)
+            )
+            if cached_page and response.status_code == 304:
+                photos = list(cached_page[1])
+            else:
                 response.raise_for_status()
                 photos = response.json()
-            
+                etag = response.headers.get("etag")
+                if etag:
+                    self._list_pages[page_key] = (etag, list(photos))
+
             # Shuffle the photos to randomize the selection
             random.shuffle(photos)
             # Take only the requested count
             photos = photos[:self.count]
 
-            # Convert Picsum photos to our image format
-            images = []
+            # Convert Picsum photos to our image format, reusing metadata already
+            # built for photos that were part of the previous selection
+            previous = self._images_by_id
+            images_by_id: dict[str, dict[str, Any]] = {}
+            id_prefix = f"{self.base_url}/id/"
             for photo in photos:
+                picsum_id = photo["id"]
                 # Generate a unique ID from the photo ID
-                image_id = f"picsum-{photo['id']}"
+                image_id = f"picsum-{picsum_id}"
+                if image_id in previous:
+                    images_by_id[image_id] = previous[image_id]
+                    continue
 
                 # Get image URLs
                 # Picsum provides images at different sizes
                 # We'll use the regular size (800x600) for display
-                regular_url = f"{self.base_url}/id/{photo['id']}/800/600"
-                raw_url = f"{self.base_url}/id/{photo['id']}/1920/1080"  # Full HD for download
+                photo_url = f"{id_prefix}{picsum_id}"
+                regular_url = photo_url + "/800/600"
+                raw_url = photo_url + "/1920/1080"  # Full HD for download
 
                 # Get dimensions from photo data
                 width = photo.get("width", 1920)
@@ -205,7 +443,7 @@ class PicsumImagePlugin(ImagePlugin):
 
                 image_metadata = {
                     "id": image_id,
-                    "filename": f"{photo['id']}.jpg",
+                    "filename": f"{picsum_id}.jpg",
                     "path": regular_url,
                     "url": regular_url,
                     "raw_url": raw_url,
@@ -217,15 +455,16 @@ class PicsumImagePlugin(ImagePlugin):
                     "title": f"Photo by {author}",
                     "photographer": author,
                     "photographer_url": author_url,
-                    "picsum_id": photo["id"],
+                    "picsum_id": picsum_id,
                     "created_at": photo.get(
                         "download_url", ""
                     ),  # Picsum doesn't provide created_at
                 }
-                images.append(image_metadata)
+                images_by_id[image_id] = image_metadata
 
-            self._images = images
-            self._last_scan = datetime.now()
+            self._images_by_id = images_by_id
+            images = self.images
+            self._last_scan_monotonic = time.monotonic()
             save_scan_cache(self.plugin_id, images)
             return images
 
@@ -234,14 +473,14 @@ class PicsumImagePlugin(ImagePlugin):
                 f"[Picsum] HTTP error fetching photos: {e.response.status_code} - {e}"
             )
             # Return cached images if available
-            return self._images.copy()
+            return self.images
         except httpx.HTTPError as e:
             logger.warning(f"[Picsum] Request error fetching photos: {e}")
             # Return cached images if available
-            return self._images.copy()
+            return self.images
         except Exception as e:
             logger.exception(f"[Picsum] Unexpected error scanning images: {e}")
-            return self._images.copy()
+            return self.images
 
     async def validate_config(self, config: dict[str, Any]) -> bool:
         """
@@ -273,9 +512,10 @@ class PicsumImagePlugin(ImagePlugin):
         if "count" in config:
             count = extract_config_value(config, "count", default=30, converter=to_int)
             self.count = min(count, 100)  # Cap at 100
+            self._fetch_limit = self._compute_fetch_limit()
 
         # Reset scan cache when config changes
-        self._last_scan = None
+        self._last_scan_monotonic = None
 
 
 # Register this plugin with pluggy
@@ -327,7 +567,3 @@ async def handle_plugin_config_update(
     return await handle_plugin_config_update_generic(
         type_id, config, enabled, db_type, session, manager_config
     )
-
-
-
-
@@ -5,8 +5,9 @@ These tests should be run from the backend directory:
     pytest ../calvin-plugins/picsum/test_picsum.py
 """
 
+import asyncio
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
-from datetime import datetime
 
 import pytest
 import httpx
@@ -42,6 +43,20 @@ except ImportError as e:
     pytest.skip(f"Backend dependencies not available: {e}", allow_module_level=True)
 
 
+def mock_image_stream(mock_client, data=b"fake image data"):
+    """Make the mocked client's stream() serve data as a single chunk."""
+
+    async def fake_aiter_bytes(chunk_size):
+        yield data
+
+    mock_response = MagicMock()
+    mock_response.aiter_bytes = fake_aiter_bytes
+    stream = mock_client.return_value.stream.return_value
+    stream.__aenter__ = AsyncMock(return_value=mock_response)
+    stream.__aexit__ = AsyncMock(return_value=False)
+    return mock_response
+
+
 @pytest.fixture
 def picsum_plugin():
     """Create a PicsumImagePlugin instance."""
@@ -99,10 +114,10 @@ class TestPicsumImagePlugin:
         ]
 
         with patch("httpx.AsyncClient") as mock_client:
-            mock_response = MagicMock()
+            mock_response = MagicMock(status_code=200)
             mock_response.json.return_value = mock_photos
             mock_response.raise_for_status = MagicMock()
-            mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
+            mock_client.return_value.get = AsyncMock(return_value=mock_response)
 
             images = await picsum_plugin.scan_images()
 
@@ -127,10 +142,10 @@ class TestPicsumImagePlugin:
         ]
 
         with patch("httpx.AsyncClient") as mock_client:
-            mock_response = MagicMock()
+            mock_response = MagicMock(status_code=200)
             mock_response.json.return_value = mock_photos
             mock_response.raise_for_status = MagicMock()
-            mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
+            mock_client.return_value.get = AsyncMock(return_value=mock_response)
 
             # First scan
             images1 = await picsum_plugin.scan_images()
@@ -138,22 +153,161 @@ class TestPicsumImagePlugin:
             images2 = await picsum_plugin.scan_images()
 
             # Should only call API once (cached on second call)
-            assert mock_client.return_value.__aenter__.return_value.get.call_count <= 1
+            assert mock_client.return_value.get.await_count <= 1
 
     @pytest.mark.asyncio
     async def test_scan_images_http_error(self, picsum_plugin):
         """Test handling of HTTP errors during scan."""
         with patch("httpx.AsyncClient") as mock_client:
-            mock_response = MagicMock()
+            mock_response = MagicMock(status_code=404)
             mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
                 "Not Found", request=MagicMock(), response=MagicMock()
             )
-            mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
+            mock_client.return_value.get = AsyncMock(return_value=mock_response)
 
             # Should return cached images or empty list
             images = await picsum_plugin.scan_images()
             assert isinstance(images, list)
 
+    @pytest.mark.asyncio
+    async def test_scan_images_retries_timeouts(self, picsum_plugin):
+        """Test that a list request that timed out connecting is retried."""
+        with patch("httpx.AsyncClient") as mock_client, patch.object(
+            picsum_module.asyncio, "sleep", new_callable=AsyncMock
+        ) as mock_sleep:
+            mock_response = MagicMock(status_code=200)
+            mock_response.json.return_value = [{"id": 1, "author": "John Doe"}]
+            mock_client.return_value.get = AsyncMock(
+                side_effect=[httpx.ConnectTimeout("unreachable"), mock_response]
+            )
+
+            images = await picsum_plugin.scan_images()
+
+            assert mock_client.return_value.get.await_count == 2
+            mock_sleep.assert_awaited_once()
+            assert [image["id"] for image in images] == ["picsum-1"]
+
+    @pytest.mark.asyncio
+    async def test_scan_images_does_not_retry_read_timeout(self, picsum_plugin):
+        """Test that a slow list response is given up on after one attempt."""
+        with patch("httpx.AsyncClient") as mock_client, patch.object(
+            picsum_module.asyncio, "sleep", new_callable=AsyncMock
+        ) as mock_sleep:
+            mock_client.return_value.get = AsyncMock(side_effect=httpx.ReadTimeout("slow"))
+
+            images = await picsum_plugin.scan_images()
+
+            mock_client.return_value.get.assert_awaited_once()
+            mock_sleep.assert_not_awaited()
+            assert images == []
+
+    @pytest.mark.asyncio
+    async def test_scan_images_reuses_client(self, picsum_plugin):
+        """Test that rescans reuse one HTTP client, which cleanup closes."""
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_response = MagicMock(status_code=200)
+            mock_response.json.return_value = []
+            mock_response.raise_for_status = MagicMock()
+            mock_client.return_value.get = AsyncMock(return_value=mock_response)
+            mock_client.return_value.aclose = AsyncMock()
+
+            await picsum_plugin.scan_images()
+            picsum_plugin._last_scan_monotonic = None
+            await picsum_plugin.scan_images()
+
+            assert mock_client.call_count == 1
+            assert mock_client.return_value.get.await_count == 2
+
+            await picsum_plugin.cleanup()
+            mock_client.return_value.aclose.assert_awaited_once()
+            assert picsum_plugin._client is None
+
+    @pytest.mark.asyncio
+    async def test_scan_images_revalidates_with_etag(self, picsum_plugin):
+        """Test that a rescan of a known page sends If-None-Match and reuses it on 304."""
+        mock_photos = [{"id": 1, "author": "John Doe", "width": 1920, "height": 1080}]
+
+        with patch("httpx.AsyncClient") as mock_client, patch.object(
+            picsum_module.random, "randint", return_value=3
+        ):
+            first = MagicMock(status_code=200, headers={"etag": '"abc"'})
+            first.json.return_value = mock_photos
+            not_modified = MagicMock(status_code=304)
+            mock_client.return_value.get = AsyncMock(side_effect=[first, not_modified])
+
+            await picsum_plugin.scan_images()
+            picsum_plugin._last_scan_monotonic = None
+            images = await picsum_plugin.scan_images()
+
+            second_call = mock_client.return_value.get.await_args_list[1]
+            assert second_call.kwargs["headers"] == {"If-None-Match": '"abc"'}
+            not_modified.json.assert_not_called()
+            assert [image["id"] for image in images] == ["picsum-1"]
+
+    @pytest.mark.asyncio
+    async def test_scan_images_reuses_known_metadata(self, picsum_plugin):
+        """Test that a rescan keeps metadata for known photos and drops unselected ones."""
+        known = {"id": "picsum-1", "url": "https://example.com/1.jpg"}
+        stale = {"id": "picsum-9", "url": "https://example.com/9.jpg"}
+        picsum_plugin._images_by_id = {"picsum-1": known, "picsum-9": stale}
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_response = MagicMock(status_code=200)
+            mock_response.json.return_value = [
+                {"id": 1, "author": "John Doe"},
+                {"id": 2, "author": "Jane Smith"},
+            ]
+            mock_client.return_value.get = AsyncMock(return_value=mock_response)
+
+            await picsum_plugin.scan_images()
+
+        assert set(picsum_plugin._images_by_id) == {"picsum-1", "picsum-2"}
+        assert picsum_plugin._images_by_id["picsum-1"] is known
+        assert picsum_plugin._images_by_id["picsum-2"]["photographer"] == "Jane Smith"
+        assert picsum_plugin._images_by_id["picsum-2"]["url"] == (
+            "https://picsum.photos/id/2/800/600"
+        )
+        assert picsum_plugin._images_by_id["picsum-2"]["raw_url"] == (
+            "https://picsum.photos/id/2/1920/1080"
+        )
+
+    @pytest.mark.asyncio
+    async def test_initialize_keeps_fresh_disk_cache(self, picsum_plugin):
+        """Test that a recent disk cache counts as fresh on the monotonic clock."""
+        from datetime import datetime, timedelta
+
+        cached = [{"id": "picsum-1"}]
+        cached_time = datetime.now() - timedelta(minutes=5)
+        with patch.object(
+            picsum_module, "load_scan_cache", return_value=(cached, cached_time)
+        ), patch("httpx.AsyncClient") as mock_client:
+            await picsum_plugin.initialize()
+
+            mock_client.assert_not_called()
+
+        assert picsum_plugin.images == cached
+        elapsed = time.monotonic() - picsum_plugin._last_scan_monotonic
+        assert 299 <= elapsed < 310
+        await picsum_plugin.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_scans_share_one_fetch(self, picsum_plugin):
+        """Test that concurrent callers of a stale selection trigger a single fetch."""
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_response = MagicMock(status_code=200)
+            mock_response.json.return_value = [{"id": 1, "author": "John Doe"}]
+
+            async def slow_get(*args, **kwargs):
+                await asyncio.sleep(0.01)
+                return mock_response
+
+            mock_client.return_value.get = AsyncMock(side_effect=slow_get)
+
+            results = await asyncio.gather(*(picsum_plugin.scan_images() for _ in range(5)))
+
+            assert mock_client.return_value.get.await_count == 1
+            assert all([image["id"] for image in images] == ["picsum-1"] for images in results)
+
     @pytest.mark.asyncio
     async def test_get_images(self, picsum_plugin):
         """Test getting images list."""
@@ -162,8 +316,8 @@ class TestPicsumImagePlugin:
         
         # Patch scan_images to set the internal state and return
         async def mock_scan():
-            picsum_plugin._images = test_images
-            picsum_plugin._last_scan = datetime.now()
+            picsum_plugin._images_by_id = {image["id"]: image for image in test_images}
+            picsum_plugin._last_scan_monotonic = time.monotonic()
             return test_images
         
         with patch.object(picsum_plugin, "scan_images", side_effect=mock_scan):
@@ -182,8 +336,8 @@ class TestPicsumImagePlugin:
         
         # Patch scan_images to set the internal state and return
         async def mock_scan():
-            picsum_plugin._images = test_images
-            picsum_plugin._last_scan = datetime.now()
+            picsum_plugin._images_by_id = {image["id"]: image for image in test_images}
+            picsum_plugin._last_scan_monotonic = time.monotonic()
             return test_images
         
         with patch.object(picsum_plugin, "scan_images", side_effect=mock_scan):
@@ -194,6 +348,17 @@ class TestPicsumImagePlugin:
             image = await picsum_plugin.get_image("picsum-nonexistent")
             assert image is None
 
+    @pytest.mark.asyncio
+    async def test_get_image_skips_scan_when_fresh(self, picsum_plugin):
+        """Test that lookups on a fresh selection don't go through scan_images."""
+        picsum_plugin._images_by_id = {"picsum-1": {"id": "picsum-1"}}
+        picsum_plugin._last_scan_monotonic = time.monotonic()
+
+        with patch.object(picsum_plugin, "scan_images", new_callable=AsyncMock) as mock_scan:
+            assert await picsum_plugin.get_image("picsum-1") == {"id": "picsum-1"}
+            assert await picsum_plugin.get_images() == [{"id": "picsum-1"}]
+            mock_scan.assert_not_awaited()
+
     @pytest.mark.asyncio
     async def test_get_image_data(self, picsum_plugin):
         """Test getting image file data."""
@@ -205,13 +370,113 @@ class TestPicsumImagePlugin:
             }
 
             with patch("httpx.AsyncClient") as mock_client:
-                mock_response = MagicMock()
-                mock_response.content = b"fake image data"
-                mock_response.raise_for_status = MagicMock()
-                mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
+                mock_image_stream(mock_client)
 
                 data = await picsum_plugin.get_image_data("picsum-1")
                 assert data == b"fake image data"
+                # Downloads go through the plugin's shared client
+                assert mock_client.call_count == 1
+                mock_client.return_value.stream.assert_called_once_with(
+                    "GET", "https://example.com/image.jpg", follow_redirects=True
+                )
+
+    @pytest.mark.asyncio
+    async def test_get_image_data_http_error(self, picsum_plugin):
+        """Test that a failed download returns None."""
+        with patch.object(picsum_plugin, "get_image", new_callable=AsyncMock) as mock_get_image:
+            mock_get_image.return_value = {"id": "picsum-1", "url": "https://example.com/1.jpg"}
+
+            with patch("httpx.AsyncClient") as mock_client:
+                mock_response = mock_image_stream(mock_client)
+                mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
+                    "Not Found", request=MagicMock(), response=MagicMock(status_code=404)
+                )
+
+                assert await picsum_plugin.get_image_data("picsum-1") is None
+                assert picsum_plugin._image_data == {}
+
+    @pytest.mark.asyncio
+    async def test_prefetch_warms_image_data(self, picsum_plugin):
+        """Test that prefetched images are served without another download."""
+        picsum_plugin._images_by_id = {
+            "picsum-1": {"id": "picsum-1", "url": "https://example.com/1.jpg"},
+            "picsum-2": {"id": "picsum-2", "url": "https://example.com/2.jpg"},
+        }
+        picsum_plugin._last_scan_monotonic = time.monotonic()
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_image_stream(mock_client)
+            mock_client.return_value.aclose = AsyncMock()
+            mock_stream = mock_client.return_value.stream
+
+            await picsum_plugin.prefetch(1)
+            mock_stream.assert_called_once_with(
+                "GET", "https://example.com/1.jpg", follow_redirects=True
+            )
+
+            assert await picsum_plugin.get_image_data("picsum-1") == b"fake image data"
+            assert mock_stream.call_count == 1
+
+            await picsum_plugin.get_image_data("picsum-2")
+            assert mock_stream.call_count == 2
+
+        await picsum_plugin.cleanup()
+        assert picsum_plugin._image_data == {}
+
+    @pytest.mark.asyncio
+    async def test_image_data_cache_is_bounded(self, picsum_plugin):
+        """Test that the image data cache evicts its least recently used entry when full."""
+        picsum_plugin._images_by_id = {
+            f"picsum-{i}": {"id": f"picsum-{i}", "url": f"https://example.com/{i}.jpg"}
+            for i in range(picsum_module.IMAGE_DATA_CACHE_SIZE + 1)
+        }
+        picsum_plugin._last_scan_monotonic = time.monotonic()
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_image_stream(mock_client, b"data")
+            image_ids = list(picsum_plugin._images_by_id)
+            for image_id in image_ids[:-1]:
+                await picsum_plugin.get_image_data(image_id)
+            # A hit makes picsum-0 the most recently used entry
+            await picsum_plugin.get_image_data("picsum-0")
+            await picsum_plugin.get_image_data(image_ids[-1])
+
+        assert len(picsum_plugin._image_data) == picsum_module.IMAGE_DATA_CACHE_SIZE
+        assert "picsum-0" in picsum_plugin._image_data
+        assert "picsum-1" not in picsum_plugin._image_data
+
+    @pytest.mark.asyncio
+    async def test_image_data_cache_skips_images_outside_selection(self, picsum_plugin):
+        """Test that cached bytes are not served once the image leaves the selection."""
+        picsum_plugin._image_data["picsum-1"] = b"old data"
+        picsum_plugin._images_by_id = {"picsum-2": {"id": "picsum-2"}}
+        picsum_plugin._last_scan_monotonic = time.monotonic()
+
+        assert await picsum_plugin.get_image_data("picsum-1") is None
+
+    @pytest.mark.asyncio
+    async def test_initialize_replaces_running_prefetch(self, picsum_plugin):
+        """Test that re-initializing cancels the previous prefetch task."""
+        picsum_plugin._last_scan_monotonic = time.monotonic()
+        started = asyncio.Event()
+
+        async def slow_prefetch(count):
+            started.set()
+            await asyncio.sleep(3600)
+
+        with patch.object(picsum_plugin, "prefetch", side_effect=slow_prefetch), patch.object(
+            picsum_module, "load_scan_cache", return_value=(None, None)
+        ):
+            await picsum_plugin.initialize()
+            first = picsum_plugin._prefetch_task
+            await started.wait()
+
+            await picsum_plugin.initialize()
+            assert first.cancelled()
+            assert picsum_plugin._prefetch_task is not first
+
+            await picsum_plugin.cleanup()
+            assert picsum_plugin._prefetch_task is None
 
     @pytest.mark.asyncio
     async def test_get_image_data_not_found(self, picsum_plugin):
@@ -221,6 +486,55 @@ class TestPicsumImagePlugin:
             data = await picsum_plugin.get_image_data("picsum-nonexistent")
             assert data is None
 
+    @pytest.mark.asyncio
+    async def test_stream_image_data(self, picsum_plugin):
+        """Test streaming image data in chunks through the plugin's client."""
+
+        async def fake_aiter_bytes(chunk_size):
+            yield b"fake "
+            yield b"image data"
+
+        with patch.object(picsum_plugin, "get_image", new_callable=AsyncMock) as mock_get_image:
+            mock_get_image.return_value = {
+                "id": "picsum-1",
+                "url": "https://example.com/image.jpg",
+            }
+
+            with patch("httpx.AsyncClient") as mock_client:
+                mock_response = MagicMock()
+                mock_response.aiter_bytes = fake_aiter_bytes
+                stream = mock_client.return_value.stream.return_value
+                stream.__aenter__ = AsyncMock(return_value=mock_response)
+                stream.__aexit__ = AsyncMock(return_value=False)
+
+                chunks = [chunk async for chunk in picsum_plugin.stream_image_data("picsum-1")]
+
+                assert b"".join(chunks) == b"fake image data"
+                mock_client.return_value.stream.assert_called_once_with(
+                    "GET", "https://example.com/image.jpg", follow_redirects=True
+                )
+
+            mock_get_image.return_value = None
+            assert [chunk async for chunk in picsum_plugin.stream_image_data("picsum-x")] == []
+
+    @pytest.mark.asyncio
+    async def test_get_image_data_many(self, picsum_plugin):
+        """Test downloading several images concurrently, in request order."""
+
+        async def fake_get_image_data(image_id):
+            if image_id == "picsum-broken":
+                raise httpx.ConnectError("boom")
+            if image_id == "picsum-missing":
+                return None
+            return image_id.encode()
+
+        with patch.object(picsum_plugin, "get_image_data", side_effect=fake_get_image_data):
+            data = await picsum_plugin.get_image_data_many(
+                ["picsum-1", "picsum-missing", "picsum-broken", "picsum-2"]
+            )
+
+        assert data == [b"picsum-1", None, None, b"picsum-2"]
+
     @pytest.mark.asyncio
     async def test_validate_config_valid(self, picsum_plugin):
         """Test config validation with valid config."""
@@ -242,13 +556,17 @@ class TestPicsumImagePlugin:
 
         await picsum_plugin.configure({"count": 50})
         assert picsum_plugin.count == 50
+        assert picsum_plugin._fetch_limit == 100
+
+        await picsum_plugin.configure({"count": 10})
+        assert picsum_plugin._fetch_limit == 50
 
         # Test capping at 100
         await picsum_plugin.configure({"count": 200})
         assert picsum_plugin.count == 100
 
         # Verify cache is reset
-        assert picsum_plugin._last_scan is None
+        assert picsum_plugin._last_scan_monotonic is None
 
 
 @pytest.mark.asyncio
@@ -303,20 +621,20 @@ class TestPicsumPluginIntegration:
         ]
 
         with patch("httpx.AsyncClient") as mock_client:
-            mock_response = MagicMock()
+            mock_response = MagicMock(status_code=200)
             mock_response.json.return_value = mock_photos
             mock_response.raise_for_status = MagicMock()
-            mock_client.return_value.__aenter__.return_value.get.return_value = mock_response
+            mock_client.return_value.get = AsyncMock(return_value=mock_response)
 
             # Reset cache
-            picsum_plugin._last_scan = None
+            picsum_plugin._last_scan_monotonic = None
             
             # First scan
             images1 = await picsum_plugin.scan_images()
             ids1 = [img["id"] for img in images1]
 
             # Reset cache and scan again
-            picsum_plugin._last_scan = None
+            picsum_plugin._last_scan_monotonic = None
             random.seed(999)  # Different seed
             images2 = await picsum_plugin.scan_images()
             ids2 = [img["id"] for img in images2]
@@ -7,21 +7,38 @@ and generates/updates the plugins.json manifest file.
 """
 
 import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add parent directory to path to import validation functions
 REPO_ROOT = Path(__file__).parent.parent
 
+# Threads used to validate plugin/theme directories
+MAX_SCAN_WORKERS = 16
+
+# Common non-plugin/theme directories skipped during the scan
+SKIP_DIRS = frozenset(
+    {
+        ".git",
+        "__pycache__",
+        "node_modules",
+        ".venv",
+        "scripts",
+        ".github",
+    }
+)
+
 
 def validate_plugin_directory(plugin_dir: Path) -> dict:
     """Validate a plugin directory and return its manifest."""
     manifest_path = plugin_dir / "plugin.json"
-    if not manifest_path.exists():
-        raise ValueError(f"plugin.json not found in {plugin_dir}")
-
-    with open(manifest_path, encoding="utf-8") as f:
-        manifest = json.load(f)
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        raise ValueError(f"plugin.json not found in {plugin_dir}") from None
 
     # Required fields
     required_fields = ["id", "name", "version", "type"]
@@ -40,11 +57,11 @@ def validate_plugin_directory(plugin_dir: Path) -> dict:
 def validate_theme_directory(theme_dir: Path) -> dict:
     """Validate a theme directory and return its manifest."""
     manifest_path = theme_dir / "theme.json"
-    if not manifest_path.exists():
-        raise ValueError(f"theme.json not found in {theme_dir}")
-
-    with open(manifest_path, encoding="utf-8") as f:
-        manifest = json.load(f)
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        raise ValueError(f"theme.json not found in {theme_dir}") from None
 
     # Required fields
     required_fields = ["id", "name", "version", "variables"]
@@ -55,63 +72,77 @@ def validate_theme_directory(theme_dir: Path) -> dict:
     return manifest
 
 
+def scan_directory(item: Path) -> tuple[dict | None, dict | None, list[str]]:
+    """Validate one repository directory as a plugin and/or theme.
+
+    Returns the plugin entry, the theme entry (either may be None) and any errors.
+    """
+    plugin = None
+    theme = None
+    errors = []
+
+    # Check for plugin
+    plugin_json = item / "plugin.json"
+    plugin_py = item / "plugin.py"
+    if plugin_json.exists() and plugin_py.exists():
+        try:
+            manifest = validate_plugin_directory(item)
+            plugin = {
+                "id": manifest["id"],
+                "name": manifest.get("name", manifest["id"]),
+                "path": item.name,
+                "description": manifest.get("description", ""),
+                "version": manifest.get("version", "1.0.0"),
+                "type": manifest.get("type", "service"),
+            }
+        except Exception as e:
+            errors.append(f"Plugin {item.name}: {e}")
+
+    # Check for theme
+    theme_json = item / "theme.json"
+    if theme_json.exists():
+        try:
+            manifest = validate_theme_directory(item)
+            theme = {
+                "id": manifest["id"],
+                "name": manifest.get("name", manifest["id"]),
+                "path": item.name,
+                "description": manifest.get("description", ""),
+                "version": manifest.get("version", "1.0.0"),
+            }
+        except Exception as e:
+            errors.append(f"Theme {item.name}: {e}")
+
+    return plugin, theme, errors
+
+
 def rebuild_manifest():
     """Rebuild the plugins.json manifest file."""
     plugins = []
     themes = []
     errors = []
 
-    # Scan repository for plugins and themes
-    for item in REPO_ROOT.iterdir():
-        if not item.is_dir():
-            continue
-
-        # Skip common non-plugin/theme directories
-        if item.name in [
-            ".git",
-            "__pycache__",
-            "node_modules",
-            ".venv",
-            "scripts",
-            ".github",
-        ]:
-            continue
-
-        # Check for plugin
-        plugin_json = item / "plugin.json"
-        plugin_py = item / "plugin.py"
-        if plugin_json.exists() and plugin_py.exists():
-            try:
-                manifest = validate_plugin_directory(item)
-                plugins.append(
-                    {
-                        "id": manifest["id"],
-                        "name": manifest.get("name", manifest["id"]),
-                        "path": item.name,
-                        "description": manifest.get("description", ""),
-                        "version": manifest.get("version", "1.0.0"),
-                        "type": manifest.get("type", "service"),
-                    }
-                )
-            except Exception as e:
-                errors.append(f"Plugin {item.name}: {e}")
-
-        # Check for theme
-        theme_json = item / "theme.json"
-        if theme_json.exists():
-            try:
-                manifest = validate_theme_directory(item)
-                themes.append(
-                    {
-                        "id": manifest["id"],
-                        "name": manifest.get("name", manifest["id"]),
-                        "path": item.name,
-                        "description": manifest.get("description", ""),
-                        "version": manifest.get("version", "1.0.0"),
-                    }
-                )
-            except Exception as e:
-                errors.append(f"Theme {item.name}: {e}")
+    # Collect candidate directories
+    candidates = []
+    with os.scandir(REPO_ROOT) as entries:
+        for entry in entries:
+            if entry.name in SKIP_DIRS:
+                continue
+
+            # DirEntry.is_dir() uses the type from the directory listing, no stat
+            if not entry.is_dir():
+                continue
+
+            candidates.append(Path(entry.path))
+
+    # Validate directories in parallel; the work is mostly file I/O
+    with ThreadPoolExecutor(max_workers=MAX_SCAN_WORKERS) as executor:
+        for plugin, theme, item_errors in executor.map(scan_directory, candidates):
+            if plugin:
+                plugins.append(plugin)
+            if theme:
+                themes.append(theme)
+            errors.extend(item_errors)
 
     # Sort by name for consistency
     plugins.sort(key=lambda x: x["name"].lower())
@@ -127,14 +158,18 @@ def rebuild_manifest():
     if themes:
         manifest["themes"] = themes
 
-    # Write manifest
+    # Write manifest, leaving the file untouched when nothing changed
     manifest_path = REPO_ROOT / "plugins.json"
-    with open(manifest_path, "w", encoding="utf-8") as f:
-        json.dump(manifest, f, indent=2)
-        f.write("\n")
+    content = (json.dumps(manifest, indent=2) + "\n").encode("utf-8")
+    try:
+        unchanged = manifest_path.read_bytes() == content
+    except FileNotFoundError:
+        unchanged = False
+    if not unchanged:
+        manifest_path.write_bytes(content)
 
     # Print results
-    print("Rebuilt plugins.json")
+    print("plugins.json unchanged" if unchanged else "Rebuilt plugins.json")
     print(f"  - Found {len(plugins)} plugin(s)")
     if themes:
         print(f"  - Found {len(themes)} theme(s)")
@@ -11,12 +11,14 @@ from app.plugins.sdk.service import (
 )
 
 
+DEFAULT_MESSAGE = "Hello from test plugin with frontend!"
+
 SERVICE_FIELDS = (
     ServiceConfigField(
         "message",
-        default="Hello from test plugin with frontend!",
+        default=DEFAULT_MESSAGE,
         converter=str,
-        transform=lambda value: str(value) if value else "Hello from test plugin with frontend!",
+        transform=lambda value: str(value) if value else DEFAULT_MESSAGE,
     ),
 )
 
@@ -37,7 +39,7 @@ class TestFrontendServicePlugin(ServicePlugin):
                 "message": {
                     "type": "string",
                     "description": "Test message to display",
-                    "default": "Hello from test plugin with frontend!",
+                    "default": DEFAULT_MESSAGE,
                     "ui": {
                         "component": "input",
                         "placeholder": "Enter a message",
@@ -60,7 +62,7 @@ class TestFrontendServicePlugin(ServicePlugin):
         self,
         plugin_id: str,
         name: str,
-        message: str = "Hello from test plugin with frontend!",
+        message: str = DEFAULT_MESSAGE,
         enabled: bool = True,
     ):
         super().__init__(plugin_id, name, enabled)
@@ -108,6 +108,14 @@ class TestTestServicePlugin:
         assert "config" in content
         assert content["config"]["message"] == "Test message"
 
+    @pytest.mark.asyncio
+    async def test_get_content_returns_fresh_dict(self, test_plugin):
+        """Test that mutating returned content does not leak into later calls."""
+        content = await test_plugin.get_content()
+        content["config"]["message"] = "Mutated"
+
+        assert (await test_plugin.get_content())["config"]["message"] == "Test message"
+
     @pytest.mark.asyncio
     async def test_get_content_with_default_message(self):
         """Test getting content with default message."""
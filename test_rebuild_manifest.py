@@ -0,0 +1,71 @@
+"""Tests for plugins.json manifest rebuilding."""
+
+import importlib.util
+import json
+from pathlib import Path
+
+
+_spec = importlib.util.spec_from_file_location(
+    "rebuild_manifest", Path(__file__).parent / "scripts" / "rebuild-manifest.py"
+)
+_mod = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_mod)
+rebuild_manifest = _mod.rebuild_manifest
+
+
+def write_plugin(repo: Path, dir_name: str, name: str) -> None:
+    plugin_dir = repo / dir_name
+    plugin_dir.mkdir()
+    (plugin_dir / "plugin.json").write_text(
+        json.dumps({"id": dir_name, "name": name, "version": "1.0.0", "type": "image"}),
+        encoding="utf-8",
+    )
+    (plugin_dir / "plugin.py").write_text("", encoding="utf-8")
+
+
+def test_rebuild_manifest_collects_sorted_plugins_and_themes(tmp_path, monkeypatch):
+    monkeypatch.setattr(_mod, "REPO_ROOT", tmp_path)
+    write_plugin(tmp_path, "zeta", "Zeta Photos")
+    write_plugin(tmp_path, "alpha", "alpha Photos")
+    theme_dir = tmp_path / "dark-theme"
+    theme_dir.mkdir()
+    (theme_dir / "theme.json").write_text(
+        json.dumps({"id": "dark", "name": "Dark", "version": "1.0.0", "variables": {}}),
+        encoding="utf-8",
+    )
+    (tmp_path / "scripts").mkdir()
+
+    assert rebuild_manifest() == 0
+
+    manifest = json.loads((tmp_path / "plugins.json").read_text(encoding="utf-8"))
+    assert [plugin["path"] for plugin in manifest["plugins"]] == ["alpha", "zeta"]
+    assert [theme["id"] for theme in manifest["themes"]] == ["dark"]
+
+
+def test_rebuild_manifest_reports_invalid_plugin(tmp_path, monkeypatch):
+    monkeypatch.setattr(_mod, "REPO_ROOT", tmp_path)
+    write_plugin(tmp_path, "good", "Good")
+    bad_dir = tmp_path / "bad"
+    bad_dir.mkdir()
+    (bad_dir / "plugin.json").write_text(json.dumps({"id": "bad"}), encoding="utf-8")
+    (bad_dir / "plugin.py").write_text("", encoding="utf-8")
+
+    assert rebuild_manifest() == 1
+
+    manifest = json.loads((tmp_path / "plugins.json").read_text(encoding="utf-8"))
+    assert [plugin["path"] for plugin in manifest["plugins"]] == ["good"]
+
+
+def test_rebuild_manifest_leaves_unchanged_file_alone(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(_mod, "REPO_ROOT", tmp_path)
+    write_plugin(tmp_path, "alpha", "Alpha")
+
+    assert rebuild_manifest() == 0
+    manifest_path = tmp_path / "plugins.json"
+    first_mtime = manifest_path.stat().st_mtime_ns
+    capsys.readouterr()
+
+    assert rebuild_manifest() == 0
+
+    assert manifest_path.stat().st_mtime_ns == first_mtime
+    assert "plugins.json unchanged" in capsys.readouterr().out
@@ -1,6 +1,8 @@
 """Weather service plugin using OpenWeatherMap API."""
 
 import hashlib
+from collections import defaultdict
+from datetime import datetime, timedelta
 from typing import Any
 
 import httpx
@@ -359,9 +361,6 @@ class WeatherServicePlugin(ServicePlugin):
             }
 
             # Process forecast - group by day and get daily min/max
-            from collections import defaultdict
-            from datetime import datetime, timedelta
-
             forecast_by_date = defaultdict(lambda: {"temps": [], "descriptions": [], "icons": []})
 
             for item in forecast_data.get("list", []):
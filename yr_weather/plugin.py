@@ -1,6 +1,8 @@
 """Yr.no weather service plugin using MET Weather API."""
 
 import hashlib
+from collections import defaultdict
+from datetime import datetime, timedelta
 from typing import Any
 
 import httpx
@@ -461,9 +463,6 @@ class YrWeatherServicePlugin(ServicePlugin):
             }
 
             # Process forecast - group by day
-            from collections import defaultdict
-            from datetime import datetime, timedelta
-
             forecast_by_date = defaultdict(lambda: {"temps": [], "symbols": [], "descriptions": []})
 
             # Process timeseries to group by day
@@ -759,14 +758,34 @@ async def handle_plugin_config_update(
 
         return True
 
+    # Instances saved before IDs came from blake2b carry a hash()-based ID; reuse the
+    # stored ID for the same coordinates so an upgrade does not duplicate them.
+    # Imported here rather than at module level so plugin discovery does not load
+    # the backend's database layer.
+    from app.models.db_models import PluginDB
+
+    existing_ids: dict[tuple[float, float], str] = {}
+    try:
+        for db_plugin in await PluginDB.objects.filter(type_id="yr_weather").all():
+            db_config = db_plugin.config or {}
+            latitude = extract_config_value(db_config, "latitude", converter=to_float)
+            longitude = extract_config_value(db_config, "longitude", converter=to_float)
+            if latitude is not None and longitude is not None:
+                existing_ids.setdefault((latitude, longitude), db_plugin.id)
+    except Exception as e:
+        logger.warning("Could not look up existing yr_weather instance IDs: {}", e)
+
     def generate_instance_id(c: dict[str, Any], t: str) -> str:
         """Generate instance ID from latitude and longitude."""
         latitude = extract_config_value(c, "latitude", converter=to_float)
         longitude = extract_config_value(c, "longitude", converter=to_float)
         if latitude is not None and longitude is not None:
-            # Generate hash from coordinates (same as original logic)
+            existing_id = existing_ids.get((latitude, longitude))
+            if existing_id:
+                return existing_id
+            # Stable across processes, unlike the salted built-in hash()
             coord_str = f"{latitude},{longitude}"
-            coord_hash = abs(hash(coord_str)) % 10000
+            coord_hash = hashlib.blake2b(coord_str.encode(), digest_size=6).hexdigest()
             return f"{t}-{coord_hash}"
         # Fallback ID if coordinates not available
         return f"{t}-instance"
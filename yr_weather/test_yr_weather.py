@@ -293,3 +293,25 @@ class TestYrWeatherPluginHooks:
         pytest.skip(
             "Backend-dependent hook test. Run from backend/tests/unit/test_plugin_hooks.py instead."
         )
+
+    async def test_handle_plugin_config_update_keeps_existing_instance_id(self):
+        """Test that an instance saved under an older ID scheme keeps its ID."""
+        oslo = {"latitude": 59.9139, "longitude": 10.7522}
+        existing = MagicMock(id="yr_weather-1234", config=oslo)
+        query = MagicMock()
+        query.all = AsyncMock(return_value=[existing])
+
+        with patch(
+            "app.models.db_models.PluginDB.objects.filter", return_value=query
+        ) as db_filter, patch.object(
+            yr_weather_module, "build_service_manager_config"
+        ) as build_config, patch.object(
+            yr_weather_module, "handle_plugin_config_update_generic", new_callable=AsyncMock
+        ):
+            await handle_plugin_config_update("yr_weather", {}, True, None, None)
+
+        db_filter.assert_called_once_with(type_id="yr_weather")
+        generate_instance_id = build_config.call_args.kwargs["generate_instance_id"]
+        assert generate_instance_id(dict(oslo), "yr_weather") == "yr_weather-1234"
+        new_id = generate_instance_id({"latitude": 60.0, "longitude": 11.0}, "yr_weather")
+        assert new_id.startswith("yr_weather-") and new_id != "yr_weather-1234"